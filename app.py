@@ -3,6 +3,7 @@
 TestGenie & EpicRoast with GroomRoom - Flask Backend API
 """
 
+from collections import Counter
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import os
@@ -503,9 +504,10 @@ def analyze_batch_vnext():
                 })
             
             # Generate batch summary
-            ready_count = sum(1 for r in results if r['status'] == 'Ready')
-            needs_refinement = sum(1 for r in results if r['status'] == 'Needs Refinement')
-            not_ready = sum(1 for r in results if r['status'] == 'Not Ready')
+            status_counts = Counter(r['status'] for r in results)
+            ready_count = status_counts['Ready']
+            needs_refinement = status_counts['Needs Refinement']
+            not_ready = status_counts['Not Ready']
             avg_score = sum(r['readiness_score'] for r in results) // len(results) if results else 0
             
             return jsonify({
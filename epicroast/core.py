@@ -5,6 +5,7 @@ Core Epic Roast functionality
 import os
 import sys
 import re
+import logging
 from typing import Optional
 from dotenv import load_dotenv
 from rich.console import Console
@@ -25,6 +26,135 @@ load_dotenv()
 # Initialize Rich console for better output
 console = Console()
 
+# Per-request diagnostics go through logging so they cost nothing below DEBUG
+logger = logging.getLogger(__name__)
+
+# HTML tags the model sometimes emits, mapped to their markdown equivalents
+_HTML_SUBS = [
+    (re.compile(r'<b>(.*?)</b>'), r'**\1**'),
+    (re.compile(r'<strong>(.*?)</strong>'), r'**\1**'),
+    (re.compile(r'<i>(.*?)</i>'), r'*\1*'),
+    (re.compile(r'<em>(.*?)</em>'), r'*\1*'),
+    # Any remaining HTML tags are dropped
+    (re.compile(r'<[^>]*>'), ''),
+]
+
+
+def _html_to_markdown(content: str) -> str:
+    """Convert bold/italic HTML tags to markdown and strip any other tags"""
+    for pattern, repl in _HTML_SUBS:
+        content = pattern.sub(repl, content)
+    return content
+
+
+# Roast prompt, formatted once per request with the level instruction and ticket content
+_ROAST_PROMPT_TEMPLATE = """Create an EPIC, HILARIOUS, and MEMORABLE roast of the following Jira ticket/content. 
+
+{roast_instruction}
+
+**🎭 HUMOR REQUIREMENTS (CRITICAL - Make it EXTREMELY FUNNY):**
+- Use WITTY comparisons and clever metaphors (e.g., "like ordering all the toppings on a pizza but getting delivered a single slice of plain cheese")
+- Add PERSONALITY and DRAMA to every sentence
+- Use CREATIVE analogies (e.g., "treasure map with an X marking 'Somewhere over there'", "one-way ticket to Confusion City")
+- Make it ENTERTAINING - readers should LAUGH OUT LOUD
+- Use SARCASM and IRONY where appropriate
+- Add WITTY one-liners and clever wordplay
+- Make comparisons RELATABLE and FUNNY (e.g., "more images than a Kardashian's Instagram", "like a frat party beer pong table")
+- Be SAVAGE but CLEVER - not just mean, but intelligently funny
+
+**CRITICAL: Output Structure (Follow this EXACT format - match the style of the examples below):**
+
+# 🔥 EPIC ROAST 🔥
+
+[Start with an ENGAGING, HILARIOUS introduction (2-4 sentences). Reference specific content from the ticket with quotes. Use maximum humor and personality. Examples:
+- "Alright, buckle up folks—this Jira ticket feels like someone copy-pasted a novel, forgot the plot, and then slapped on **High Priority** because decimals are scary. Let's slice through the data-feed drama:"
+- "Buckle up, folks, because this Jira ticket is riding a one-way ticket to Confusion City with a layover in Vague-Ville. Sit back as we dissect this 'masterpiece' of ambiguity, served piping hot and extra crispy."
+- "Imagine you're handed a treasure map with an X marking 'Somewhere over there' and told, 'Good luck!' That's basically what this ticket feels like."]
+
+[Add 2-3 MORE witty observations with specific quotes from the ticket, like:
+- "Update datatype to Integer" Great. So we ignore 0.5 capacity? Perfect. Who needs half a shipping slot anyway? 🙃
+- "In Discovery" Yeah, we're still **discovering** that decimals aren't integers. Nobel Prize material right here. 🏆
+- "Test 24.001 v2: Sticky Top 5 + Flyout"? Great, so we're QA'ing filters or auditioning NASA's next launch sequence? 🙃]
+
+---
+
+## 📋 Key Issues Found:
+
+[Use bullet points with bold titles and emojis. Each issue should be HILARIOUS and SPECIFIC:]
+
+- **[Issue Name with Emoji]** ❓  
+  "[Direct quote from ticket showing the problem]"  
+  [EXTREMELY WITTY comment with clever comparison. Examples:
+  - "Umm… update where? In SFCC, Deck, OMS, or our dreams? Pick one."
+  - "That's like saying 'Drive to Mars and then back,' with no rocket or fuel plan."
+  - "We've got more images than a Kardashian's Instagram. No context, no clarity, just a gallery of 'Here's some XML… maybe fix it?' 🎨"
+  - "Who picked 'Test 24.001'? This reads like a rogue lottery ticket—no clear steps, no context, just a cryptic code that makes QA feel like treasure hunters."
+  - "Unless these filters personally deposit 600K into the bank, this figure belongs in the CFO's keynote, not buried in a dev ticket."]
+
+- **[Issue Name 2 with Emoji]** 🎯  
+  "[Another direct quote from ticket]"  
+  [Another HILARIOUS, specific comment with creative analogy. Examples:
+  - "Zero labels on a Medium-priority Jira story? It's like launching a rocket with no coordinates—nobody knows how to track or triage this mess."
+  - "These acceptance criteria are a blender of scenarios—QA needs a sextant and a crystal ball to navigate this storm."
+  - "We've got at least four 'AI-generated' disclaimers clogging the comment feed. Is this ticket a filter story or an AI experiment?"]
+
+- **[Issue Name 3 with Emoji]** 🗃️  
+  "[Quote or specific example]"  
+  [Witty comment with funny comparison. Examples:
+  - "You dropped 'Joomla migration,' 'SAP feed,' 'Everest,' and 'Collab' in the same paragraph. We're lost in the buzzword jungle."
+  - "Using a decimal in story points? What's next, velocity measured in millimeters? Either round it or call it Fibonacci—this 5.0 stunt is just flexing your Python background."
+  - "Tossed in every buzzword from 'PWA' to 'MMT' like a frat party beer pong table. Less is more, people—this looks like the War and Peace of Jira stories."]
+
+[Continue with 4-6 major issues, each following the format above. Be SPECIFIC - quote actual content from the ticket. Make each one FUNNIER than the last!]
+
+---
+
+## 💡 Suggestions for Improvement:
+
+[Use bullet points with bold titles and emojis. Each suggestion should be actionable, specific, AND include a witty comment:]
+
+- **[Suggestion Title]** ✍️  
+  [Specific, actionable suggestion with example AND a funny comment. Examples:
+  - "Spell out exactly which service, object, and field you're changing. No more treasure hunts."
+  - "Replace 'Test 24.001 v2' with a descriptive title like 'Filter Flyout Opening – Desktop & Tablet Steps' and enumerate steps. No more cryptic decimals that make QA feel like codebreakers."]
+
+- **[Suggestion Title 2]** ✅  
+  [Another specific suggestion with example AND humor. Examples:
+  - "'Priority must truncate decimals by rounding down, verified by these three unit tests.' Because 'it works on my machine' isn't a test plan."
+  - "Move the 'Annual Domain… $600,550' to a Business Case doc or remove it entirely. Stick to filter functionality here—we're not running a finance seminar."]
+
+- **[Suggestion Title 3]** 📷  
+  [Another specific suggestion with wit. Examples:
+  - "One sample XML snippet beats ten unlabeled screenshots. Quality over quantity, people."
+  - "Add labels like PWA-Filter-UX, QA-Ready, Design-Complete to guide triage and filtering. No more 'Labels: None'—even a lost puppy has a tag."]
+
+[Add 4-6 specific, actionable suggestions based on the actual ticket content. Make each one CLEVER and FUNNY!]
+
+---
+
+## 🎯 Final Verdict:
+
+[End with a MEMORABLE, HILARIOUS one-liner or 2-3 sentences that summarize the roast. Use a CLEVER metaphor or comparison. Examples:
+- "This ticket is basically a game of **'pin the decimal on the integer'** with no roadmap—time to tighten up before we drown in data-level quicksand. 🚀"
+- "This ticket currently reads like modern art—open to interpretation but leaving everyone scratching their heads. With some ruthless pruning, crystal-clear criteria, and real metrics, it has the potential to be less 'abstract chaos' and more 'engineered brilliance.' Until then, it's serving up confusion sandwiches with a side of developer frustration."
+- "This ticket is basically a game of 'Guess Who?' meets 'Pin the Decimal on the Story Point,' with a side of AI spam and budget flexing. Time to trim the fat, tighten the bullet points, and give QA a fighting chance before they drown in this filter-themed quicksand. 🚀"]
+
+**CRITICAL REQUIREMENTS:**
+1. **Quote actual content** from the ticket - use quotes like "Update datatype to Integer" or "Test 24.001 v2"
+2. **Be EXTREMELY WITTY and FUNNY** - use clever comparisons, creative metaphors, and maximum humor
+3. **Be specific** - reference exact phrases, fields, or sections from the ticket
+4. **Use emojis strategically** - ❓ 🎯 🗃️ 📊 🔄 ✍️ ✅ 📷 📈 🕵️‍♀️ 🚀 🙃 🏆 🎨 💰 🌊 🤖 🔢
+5. **Match the example style** - engaging intro, bullet points with bold titles, quotes from ticket, HILARIOUS comments, memorable verdict
+6. **Make it ENTERTAINING** - readers should laugh, smile, and remember this roast
+7. **Use CREATIVE analogies** - compare to relatable, funny situations (pizza orders, treasure maps, rocket launches, etc.)
+
+Here's the content to roast:
+
+{ticket_content}
+
+Generate the roast now (follow the structure and style above EXACTLY - quote actual content, be EXTREMELY WITTY and FUNNY, be specific, make it MEMORABLE and ENTERTAINING):"""
+
+
 class EpicRoast:
     """Main Epic Roast application class"""
     
@@ -306,6 +436,17 @@ Use markdown headings (# for main, ## for sub) and dramatic emojis to make your
     
     def generate_roast(self, ticket_content: str, theme: str = "default", level: str = "savage") -> str:
         """Generate a roast using Azure OpenAI - Simplified working logic"""
+        # Check the client before building any prompts, so misconfigured installs fail fast
+        if not self.client:
+            logger.error("EpicRoast Azure OpenAI client not initialized; setup_azure_openai() failed, "
+                         "check the environment variables and startup errors")
+            return self.get_fallback_roast()
+        
+        deployment_name = os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME')
+        if not deployment_name:
+            logger.error("AZURE_OPENAI_DEPLOYMENT_NAME not set in environment variables")
+            return self.get_fallback_roast()
+        
         theme_prompt = self.get_roast_theme_prompt(theme, level)
         
         # ⬅️ Map level names (handle both formats)
@@ -330,130 +471,14 @@ Use markdown headings (# for main, ## for sub) and dramatic emojis to make your
         # ⬅️ Build detailed, structured prompt matching the user's example style
         roast_instruction = roast_level_instructions.get(normalized_level, roast_level_instructions['savage'])
         
-        prompt = f"""Create an EPIC, HILARIOUS, and MEMORABLE roast of the following Jira ticket/content. 
-
-{roast_instruction}
-
-**🎭 HUMOR REQUIREMENTS (CRITICAL - Make it EXTREMELY FUNNY):**
-- Use WITTY comparisons and clever metaphors (e.g., "like ordering all the toppings on a pizza but getting delivered a single slice of plain cheese")
-- Add PERSONALITY and DRAMA to every sentence
-- Use CREATIVE analogies (e.g., "treasure map with an X marking 'Somewhere over there'", "one-way ticket to Confusion City")
-- Make it ENTERTAINING - readers should LAUGH OUT LOUD
-- Use SARCASM and IRONY where appropriate
-- Add WITTY one-liners and clever wordplay
-- Make comparisons RELATABLE and FUNNY (e.g., "more images than a Kardashian's Instagram", "like a frat party beer pong table")
-- Be SAVAGE but CLEVER - not just mean, but intelligently funny
-
-**CRITICAL: Output Structure (Follow this EXACT format - match the style of the examples below):**
-
-# 🔥 EPIC ROAST 🔥
-
-[Start with an ENGAGING, HILARIOUS introduction (2-4 sentences). Reference specific content from the ticket with quotes. Use maximum humor and personality. Examples:
-- "Alright, buckle up folks—this Jira ticket feels like someone copy-pasted a novel, forgot the plot, and then slapped on **High Priority** because decimals are scary. Let's slice through the data-feed drama:"
-- "Buckle up, folks, because this Jira ticket is riding a one-way ticket to Confusion City with a layover in Vague-Ville. Sit back as we dissect this 'masterpiece' of ambiguity, served piping hot and extra crispy."
-- "Imagine you're handed a treasure map with an X marking 'Somewhere over there' and told, 'Good luck!' That's basically what this ticket feels like."]
-
-[Add 2-3 MORE witty observations with specific quotes from the ticket, like:
-- "Update datatype to Integer" Great. So we ignore 0.5 capacity? Perfect. Who needs half a shipping slot anyway? 🙃
-- "In Discovery" Yeah, we're still **discovering** that decimals aren't integers. Nobel Prize material right here. 🏆
-- "Test 24.001 v2: Sticky Top 5 + Flyout"? Great, so we're QA'ing filters or auditioning NASA's next launch sequence? 🙃]
-
----
-
-## 📋 Key Issues Found:
-
-[Use bullet points with bold titles and emojis. Each issue should be HILARIOUS and SPECIFIC:]
-
-- **[Issue Name with Emoji]** ❓  
-  "[Direct quote from ticket showing the problem]"  
-  [EXTREMELY WITTY comment with clever comparison. Examples:
-  - "Umm… update where? In SFCC, Deck, OMS, or our dreams? Pick one."
-  - "That's like saying 'Drive to Mars and then back,' with no rocket or fuel plan."
-  - "We've got more images than a Kardashian's Instagram. No context, no clarity, just a gallery of 'Here's some XML… maybe fix it?' 🎨"
-  - "Who picked 'Test 24.001'? This reads like a rogue lottery ticket—no clear steps, no context, just a cryptic code that makes QA feel like treasure hunters."
-  - "Unless these filters personally deposit 600K into the bank, this figure belongs in the CFO's keynote, not buried in a dev ticket."]
-
-- **[Issue Name 2 with Emoji]** 🎯  
-  "[Another direct quote from ticket]"  
-  [Another HILARIOUS, specific comment with creative analogy. Examples:
-  - "Zero labels on a Medium-priority Jira story? It's like launching a rocket with no coordinates—nobody knows how to track or triage this mess."
-  - "These acceptance criteria are a blender of scenarios—QA needs a sextant and a crystal ball to navigate this storm."
-  - "We've got at least four 'AI-generated' disclaimers clogging the comment feed. Is this ticket a filter story or an AI experiment?"]
-
-- **[Issue Name 3 with Emoji]** 🗃️  
-  "[Quote or specific example]"  
-  [Witty comment with funny comparison. Examples:
-  - "You dropped 'Joomla migration,' 'SAP feed,' 'Everest,' and 'Collab' in the same paragraph. We're lost in the buzzword jungle."
-  - "Using a decimal in story points? What's next, velocity measured in millimeters? Either round it or call it Fibonacci—this 5.0 stunt is just flexing your Python background."
-  - "Tossed in every buzzword from 'PWA' to 'MMT' like a frat party beer pong table. Less is more, people—this looks like the War and Peace of Jira stories."]
-
-[Continue with 4-6 major issues, each following the format above. Be SPECIFIC - quote actual content from the ticket. Make each one FUNNIER than the last!]
-
----
-
-## 💡 Suggestions for Improvement:
-
-[Use bullet points with bold titles and emojis. Each suggestion should be actionable, specific, AND include a witty comment:]
-
-- **[Suggestion Title]** ✍️  
-  [Specific, actionable suggestion with example AND a funny comment. Examples:
-  - "Spell out exactly which service, object, and field you're changing. No more treasure hunts."
-  - "Replace 'Test 24.001 v2' with a descriptive title like 'Filter Flyout Opening – Desktop & Tablet Steps' and enumerate steps. No more cryptic decimals that make QA feel like codebreakers."]
-
-- **[Suggestion Title 2]** ✅  
-  [Another specific suggestion with example AND humor. Examples:
-  - "'Priority must truncate decimals by rounding down, verified by these three unit tests.' Because 'it works on my machine' isn't a test plan."
-  - "Move the 'Annual Domain… $600,550' to a Business Case doc or remove it entirely. Stick to filter functionality here—we're not running a finance seminar."]
-
-- **[Suggestion Title 3]** 📷  
-  [Another specific suggestion with wit. Examples:
-  - "One sample XML snippet beats ten unlabeled screenshots. Quality over quantity, people."
-  - "Add labels like PWA-Filter-UX, QA-Ready, Design-Complete to guide triage and filtering. No more 'Labels: None'—even a lost puppy has a tag."]
-
-[Add 4-6 specific, actionable suggestions based on the actual ticket content. Make each one CLEVER and FUNNY!]
-
----
-
-## 🎯 Final Verdict:
-
-[End with a MEMORABLE, HILARIOUS one-liner or 2-3 sentences that summarize the roast. Use a CLEVER metaphor or comparison. Examples:
-- "This ticket is basically a game of **'pin the decimal on the integer'** with no roadmap—time to tighten up before we drown in data-level quicksand. 🚀"
-- "This ticket currently reads like modern art—open to interpretation but leaving everyone scratching their heads. With some ruthless pruning, crystal-clear criteria, and real metrics, it has the potential to be less 'abstract chaos' and more 'engineered brilliance.' Until then, it's serving up confusion sandwiches with a side of developer frustration."
-- "This ticket is basically a game of 'Guess Who?' meets 'Pin the Decimal on the Story Point,' with a side of AI spam and budget flexing. Time to trim the fat, tighten the bullet points, and give QA a fighting chance before they drown in this filter-themed quicksand. 🚀"]
-
-**CRITICAL REQUIREMENTS:**
-1. **Quote actual content** from the ticket - use quotes like "Update datatype to Integer" or "Test 24.001 v2"
-2. **Be EXTREMELY WITTY and FUNNY** - use clever comparisons, creative metaphors, and maximum humor
-3. **Be specific** - reference exact phrases, fields, or sections from the ticket
-4. **Use emojis strategically** - ❓ 🎯 🗃️ 📊 🔄 ✍️ ✅ 📷 📈 🕵️‍♀️ 🚀 🙃 🏆 🎨 💰 🌊 🤖 🔢
-5. **Match the example style** - engaging intro, bullet points with bold titles, quotes from ticket, HILARIOUS comments, memorable verdict
-6. **Make it ENTERTAINING** - readers should laugh, smile, and remember this roast
-7. **Use CREATIVE analogies** - compare to relatable, funny situations (pizza orders, treasure maps, rocket launches, etc.)
-
-Here's the content to roast:
-
-{ticket_content}
-
-Generate the roast now (follow the structure and style above EXACTLY - quote actual content, be EXTREMELY WITTY and FUNNY, be specific, make it MEMORABLE and ENTERTAINING):"""
+        prompt = _ROAST_PROMPT_TEMPLATE.format(
+            roast_instruction=roast_instruction,
+            ticket_content=ticket_content
+        )
         
         try:
-            # Check if client is initialized
-            if not self.client:
-                # Log why client is None
-                print(f"❌ ERROR: EpicRoast client is None!")
-                print(f"   This means setup_azure_openai() failed during initialization")
-                print(f"   Check Railway logs for Azure OpenAI setup errors above")
-                console.print("[red]Azure OpenAI client not initialized. Check your environment variables.[/red]")
-                return self.get_fallback_roast()
-            
-            deployment_name = os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME')
-            if not deployment_name:
-                print(f"❌ ERROR: AZURE_OPENAI_DEPLOYMENT_NAME not set in environment variables")
-                console.print("[red]AZURE_OPENAI_DEPLOYMENT_NAME not set[/red]")
-                return self.get_fallback_roast()
-            
             # Make API call with explicit timeout and retry handling
-            console.print("[blue]Calling Azure OpenAI API...[/blue]")
+            logger.debug("Calling Azure OpenAI deployment %s (level=%s)", deployment_name, normalized_level)
             response = self.client.chat.completions.create(
                 model=deployment_name,
                 messages=[
@@ -464,19 +489,12 @@ Generate the roast now (follow the structure and style above EXACTLY - quote act
                 timeout=60.0  # 60 second timeout for longer responses
                 # Note: o4-mini model only supports default temperature, so we don't set it
             )
-            console.print("[green]✅ API call successful![/green]")
+            logger.debug("Azure OpenAI roast call succeeded")
             
             roast_content = response.choices[0].message.content
             
             # Clean up any HTML tags that might have been generated
-            # Convert HTML bold/strong tags to markdown bold
-            roast_content = re.sub(r'<b>(.*?)</b>', r'**\1**', roast_content)
-            roast_content = re.sub(r'<strong>(.*?)</strong>', r'**\1**', roast_content)
-            # Convert HTML italic/em tags to markdown italic
-            roast_content = re.sub(r'<i>(.*?)</i>', r'*\1*', roast_content)
-            roast_content = re.sub(r'<em>(.*?)</em>', r'*\1*', roast_content)
-            # Additional cleanup for any remaining HTML tags
-            roast_content = re.sub(r'<[^>]*>', '', roast_content)
+            roast_content = _html_to_markdown(roast_content)
             
             # Validate Very Light level content
             if normalized_level == "very_light":
@@ -485,42 +503,17 @@ Generate the roast now (follow the structure and style above EXACTLY - quote act
             return roast_content
             
         except openai.APIError as e:
-            error_msg = str(e)
-            print(f"❌ ERROR: EpicRoast Azure OpenAI API Error!")
-            print(f"   Error Message: {error_msg}")
-            if hasattr(e, 'message'):
-                print(f"   API Message: {e.message}")
-            if hasattr(e, 'status_code'):
-                print(f"   Status Code: {e.status_code}")
-            console.print(f"[red]Azure OpenAI API Error: {error_msg}[/red]")
-            if hasattr(e, 'message'):
-                console.print(f"[yellow]Error message: {e.message}[/yellow]")
-            if hasattr(e, 'status_code'):
-                console.print(f"[yellow]Status code: {e.status_code}[/yellow]")
+            logger.error("EpicRoast Azure OpenAI API error: %s (message=%s, status code=%s)",
+                         e, getattr(e, 'message', None), getattr(e, 'status_code', None))
             return self.get_fallback_roast()
         except openai.APIConnectionError as e:
-            error_msg = str(e)
             endpoint = os.getenv('AZURE_OPENAI_ENDPOINT', 'NOT SET')
-            print(f"❌ ERROR: EpicRoast Azure OpenAI Connection Error!")
-            print(f"   Error Message: {error_msg}")
-            print(f"   Endpoint: {endpoint[:50]}...")
-            print(f"   Check network connection and Azure OpenAI endpoint")
-            console.print(f"[red]Azure OpenAI Connection Error: {error_msg}[/red]")
-            console.print("[yellow]Check your network connection and Azure OpenAI endpoint.[/yellow]")
-            console.print(f"[yellow]Endpoint: {endpoint[:50]}...[/yellow]")
+            logger.error("EpicRoast Azure OpenAI connection error: %s (endpoint %s...); "
+                         "check the network connection and endpoint", e, endpoint[:50])
             return self.get_fallback_roast()
         except Exception as e:
-            error_type = type(e).__name__
-            error_msg = str(e)
-            print(f"❌ ERROR: EpicRoast unexpected error!")
-            print(f"   Error Type: {error_type}")
-            print(f"   Error Message: {error_msg}")
-            import traceback
-            print("   Full Traceback:")
-            traceback.print_exc()
-            console.print(f"[red]Error generating roast: {error_type}: {error_msg}[/red]")
-            console.print(f"[yellow]Full traceback:[/yellow]")
-            console.print(f"[yellow]{traceback.format_exc()}[/yellow]")
+            # One record carries the type, message and traceback
+            logger.exception("EpicRoast unexpected error generating roast: %s", e)
             return self.get_fallback_roast()
     
     def _validate_very_light_content(self, content: str, ticket_content: str) -> str:
@@ -589,11 +582,7 @@ You are an analytical assistant. This is for the 'Very Light' roast level - NO h
                 new_content = response.choices[0].message.content
                 
                 # Clean up HTML tags in the new content
-                new_content = re.sub(r'<b>(.*?)</b>', r'**\1**', new_content)
-                new_content = re.sub(r'<strong>(.*?)</strong>', r'**\1**', new_content)
-                new_content = re.sub(r'<i>(.*?)</i>', r'*\1*', new_content)
-                new_content = re.sub(r'<em>(.*?)</em>', r'*\1*', new_content)
-                new_content = re.sub(r'<[^>]*>', '', new_content)
+                new_content = _html_to_markdown(new_content)
                 
                 return new_content
                 
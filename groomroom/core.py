@@ -4,9 +4,19 @@ Core GroomRoom Refinement Agent - AI-driven Jira ticket analysis and refinement
 
 import os
 import sys
+import asyncio
+import copy
+import threading
 import re
 import hashlib
+import io
 import json
+from collections import Counter, OrderedDict, defaultdict
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from string import Template
 from typing import Optional, Dict, List, Any, Tuple, Union
 from dotenv import load_dotenv
 from rich.console import Console
@@ -20,19 +30,712 @@ except ImportError:
     JiraIntegration = None
     JiraFieldMapper = None
 
+try:
+    import ahocorasick
+except ImportError:
+    # Fall back to plain substring scans when pyahocorasick is not installed
+    ahocorasick = None
+
 # Load environment variables
 load_dotenv()
 
 # Initialize Rich console for better output
 console = Console()
 
+
+@lru_cache(maxsize=64)
+def _lower(text: str) -> str:
+    """Lowercase a ticket field once and share the copy across analyzers"""
+    return text.lower()
+
+
+def _pasted_content_issue(content: str) -> Dict[str, Any]:
+    """Wrap pasted ticket text in a minimal Jira issue so it can go through extract_jira_fields"""
+    return {
+        'key': 'PASTED-CONTENT',
+        'fields': {
+            'summary': 'Pasted Content Analysis',
+            'description': content,
+            'issuetype': {'name': 'Unknown'},
+            'status': {'name': 'Unknown'},
+            'priority': {'name': 'None'},
+            'assignee': None,
+            'reporter': None,
+            'created': '',
+            'updated': '',
+            'project': {'name': 'Unknown'},
+            'labels': [],
+            'components': []
+        }
+    }
+
+
+# Readiness markers shared by the mode formatters and markdown generators
+_READY_MARKER = "✅"
+_NEEDS_REFINEMENT_MARKER = "⚠️"
+_NOT_READY_MARKER = "❌"
+
+
+def _readiness_marker(score: float) -> str:
+    """Pick the readiness emoji for a 0-100 score (90+ ready, 70+ needs refinement)"""
+    if score >= 90:
+        return _READY_MARKER
+    if score >= 70:
+        return _NEEDS_REFINEMENT_MARKER
+    return _NOT_READY_MARKER
+
+
+# Markdown markers for technical/ADA statuses; anything else renders as missing
+_TECH_STATUS_EMOJI = {'OK': _READY_MARKER, 'Partial': _NEEDS_REFINEMENT_MARKER}
+
+# Fixed layout of the compact summary report; list blocks carry their own trailing newlines
+_SUMMARY_MARKDOWN_TEMPLATE = (
+    "📊 Summary — {ticket_key}\n"
+    "Readiness: {score}% → {status_emoji} {status}\n"
+    "\n"
+    "Top 3 gaps:\n"
+    "{gaps}"
+    "\n"
+    "Next 3 actions:\n"
+    "{actions}"
+    "\n"
+    "Framework scores: ROI {frameworks[ROI]} | INVEST {frameworks[INVEST]} | ACCEPT {frameworks[ACCEPT]} | 3C {frameworks[3C]}"
+)
+
+# Card-type cues in lowercased ticket text, scanned zero-width so every position is checked
+_CARD_TYPE_KEYWORD_RE = re.compile(
+    r'(?=(?P<user_story>as a|i want|so that)'
+    r'|(?P<bug>bug|error|broken|not working)'
+    r'|(?P<task>task|config|documentation))'
+)
+
+# Display labels for detected card types, title-cased once
+_CARD_TYPE_LABELS = {card_type: card_type.title() for card_type in ('user_story', 'bug', 'task', 'feature')}
+
+# Display labels for the groom output modes, title-cased once
+_MODE_LABELS = {mode: mode.title() for mode in ('actionable', 'insight', 'summary')}
+
+
+@lru_cache(maxsize=64)
+def _field_label(field_key: str) -> str:
+    """Turn an unmapped field key into a readable label"""
+    return field_key.replace('_', ' ').title()
+
+
+def _md_bullets(lines) -> str:
+    """Render non-blank lines as a markdown bullet list"""
+    return "\n".join([f"- {x}" for x in lines if str(x).strip()])
+
+
+def _md_numbered(lines) -> str:
+    """Render non-blank lines as a numbered list, keeping the original positions"""
+    out = []
+    append = out.append
+    for i, x in enumerate(lines, 1):
+        x = str(x).strip()
+        if x:
+            append(f"{i}. {x}")
+    return "\n".join(out) if out else "1. (add acceptance criteria)"
+
+
+def _stripped_nonblank(items) -> List[str]:
+    """Stringify and strip each item once, keeping the non-blank results"""
+    return [text for text in (str(item).strip() for item in items) if text]
+
+
+def _field_texts(value) -> List[str]:
+    """Normalize a text or list field value into stripped, non-blank texts"""
+    if isinstance(value, str):
+        value = value.strip()
+        return [value] if value else []
+    if isinstance(value, list):
+        return _stripped_nonblank(value)
+    return []
+
+
+# Whole-word token sets used for brand and page checks
+_WORD_RE = re.compile(r'\w+')
+_ELF_PAGE_TOKENS = frozenset({'plp', 'pdp', 'homepage', 'minicart'})
+_BNPL_TOKENS = frozenset({'afterpay', 'klarna'})
+
+
+def _word_tokens(text: str) -> frozenset:
+    """Tokenize text once into a lowercased set of whole words"""
+    return frozenset(token.lower() for token in _WORD_RE.findall(text))
+
+
+# DoR requirement indicators, built once instead of per check
+_IMPLEMENTATION_INDICATORS = frozenset({'pr', 'pull request', 'deploy', 'deployment', 'implementation', 'technical'})
+_ARCHITECTURE_INDICATORS = frozenset({'design', 'architecture', 'workflow', 'diagram', 'figma', 'mockup'})
+_ADA_INDICATORS = frozenset({'accessibility', 'ada', 'wcag', 'screen reader', 'keyboard', 'aria'})
+_WEAK_AC_INDICATORS = frozenset({
+    'should', 'could', 'might', 'maybe', 'possibly',
+    'as needed', 'if required', 'when appropriate',
+    'user friendly', 'intuitive', 'easy to use'
+})
+
+# DoR indicator groups matched in a single pass over the lowercased text
+_DOR_INDICATOR_GROUPS = {
+    'implementation': _IMPLEMENTATION_INDICATORS,
+    'architecture': _ARCHITECTURE_INDICATORS,
+    'ada': _ADA_INDICATORS
+}
+
+
+def _build_group_automaton(groups: Dict[str, frozenset]):
+    """Build one Aho-Corasick automaton tagging each keyword with the groups it belongs to"""
+    if ahocorasick is None:
+        return None
+    
+    owners = defaultdict(list)
+    for group, keywords in groups.items():
+        for keyword in keywords:
+            owners[keyword].append(group)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_groups in owners.items():
+        automaton.add_word(keyword, tuple(keyword_groups))
+    automaton.make_automaton()
+    return automaton
+
+
+def _scan_groups(automaton, groups: Dict[str, frozenset], text_lower: str) -> frozenset:
+    """Return the groups with a keyword in lowercased text, in one automaton pass when available"""
+    if automaton is not None:
+        return frozenset(group for _, keyword_groups in automaton.iter(text_lower) for group in keyword_groups)
+    return frozenset(
+        group for group, keywords in groups.items()
+        if any(map(text_lower.__contains__, keywords))
+    )
+
+
+_DOR_INDICATOR_AUTOMATON = _build_group_automaton(_DOR_INDICATOR_GROUPS)
+
+
+@lru_cache(maxsize=64)
+def _dor_indicator_hits(text_lower: str) -> frozenset:
+    """Return the DoR indicator groups present in lowercased text, scanning it once"""
+    return _scan_groups(_DOR_INDICATOR_AUTOMATON, _DOR_INDICATOR_GROUPS, text_lower)
+
+
+# Technical/ADA status cues for _analyze_technical_ada; "*_ok" outranks "*_partial"
+_TECHNICAL_ADA_GROUPS = {
+    'impl_ok': frozenset({'api', 'database', 'service'}),
+    'impl_partial': frozenset({'system', 'application'}),
+    'arch_ok': frozenset({'architecture', 'design', 'pattern'}),
+    'arch_partial': frozenset({'integration', 'component'}),
+    'ada_ok': frozenset({'accessibility', 'ada'}),
+    'ada_partial': frozenset({'ui', 'interface'}),
+    'performance': frozenset({'performance'}),
+    'security': frozenset({'security'}),
+    'devops': frozenset({'deployment', 'devops'})
+}
+_TECHNICAL_ADA_AUTOMATON = _build_group_automaton(_TECHNICAL_ADA_GROUPS)
+
+# AC quality cues shared by _analyze_ac_quality (scoring) and _identify_ac_issues (narrower issue lists)
+_AC_QUALITY_GROUPS = {
+    'testable': frozenset({'verify', 'check', 'confirm', 'validate', 'ensure', 'should', 'must', 'will'}),
+    'testable_issue': frozenset({'verify', 'check', 'confirm', 'validate', 'ensure'}),
+    'vague': frozenset({'good', 'nice', 'better', 'improved', 'enhanced', 'user-friendly'}),
+    'vague_issue': frozenset({'good', 'nice', 'better', 'improved'}),
+    'technical': frozenset({'click', 'button', 'api', 'database', 'code', 'function'}),
+    'technical_issue': frozenset({'click', 'button', 'api', 'database'}),
+    'measurable': frozenset({'display', 'show', 'appear', 'contain', 'include', 'have'})
+}
+_AC_QUALITY_AUTOMATON = _build_group_automaton(_AC_QUALITY_GROUPS)
+
+
+@lru_cache(maxsize=128)
+def _ac_quality_hits(ac_lower: str) -> frozenset:
+    """Return the AC quality groups present in a lowercased AC, scanning it once for scoring and issues"""
+    return _scan_groups(_AC_QUALITY_AUTOMATON, _AC_QUALITY_GROUPS, ac_lower)
+
+
+def _keyword_alternation(*keywords: str):
+    """Compile literal keywords into one alternation regex, a C-level 'any keyword in text' test"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+# Role routing for recommendations in the actionable output, matched in one pass per recommendation
+_RECOMMENDATION_ROLE_GROUPS = {
+    'po': frozenset({'story', 'acceptance', 'criteria', 'business'}),
+    'qa': frozenset({'test', 'scenario', 'qa', 'testing'}),
+    'dev': frozenset({'implementation', 'technical', 'architecture', 'deployment'})
+}
+_RECOMMENDATION_ROLE_AUTOMATON = _build_group_automaton(_RECOMMENDATION_ROLE_GROUPS)
+
+
+# Keyword groups for the partial technical, ADA, NFR and edge-case checks (matched against lowercased text)
+_PARTIAL_IMPLEMENTATION_RE = _keyword_alternation('implementation', 'technical', 'code', 'api')
+_PARTIAL_ARCHITECTURE_RE = _keyword_alternation('architecture', 'design', 'system', 'component')
+_ACCESSIBILITY_RE = _keyword_alternation('accessibility', 'ada', 'wcag', 'screen reader', 'keyboard', 'focus', 'alt text', 'contrast')
+_NFR_PERFORMANCE_RE = _keyword_alternation('performance', 'speed', 'response time', 'load')
+_NFR_SECURITY_RE = _keyword_alternation('security', 'authentication', 'authorization', 'encryption')
+_NFR_DEVOPS_RE = _keyword_alternation('deployment', 'infrastructure', 'monitoring', 'logging')
+_EDGE_CASE_RE = _keyword_alternation('error', 'invalid', 'empty', 'null', 'exception', 'timeout')
+
+
+# Jira ticket keys such as "ABC-123", as opposed to pasted ticket text
+_TICKET_KEY_RE = re.compile(r'^[A-Z]+-\d+$')
+
+# Figma URLs in descriptions and comments
+_FIGMA_URL_RE = re.compile(r'https?://[^\s]*figma[^\s]*', re.IGNORECASE)
+
+# "As a <persona>, I want/need/should be able to <goal>, so that <benefit>" story sentence, one scan.
+# The clause runs are possessive ([^,]++): they must end at a comma anyway, so giving characters
+# back can never help, and every stray "as" (has, was, class) fails without backtracking.
+_USER_STORY_RE = re.compile(
+    r'as\s+(?:a\s+)?([^,]++),\s*i\s+(?:want|need|should\s+be\s+able\s+to)\s+([^,]++),\s*so\s+that\s+(.+)',
+    re.IGNORECASE
+)
+
+# The same sentence per verb, in the want → need → should priority analyze_story reports
+_USER_STORY_PATTERNS = tuple(
+    re.compile(rf'as\s+(?:a\s+)?([^,]++),\s*i\s+{verb}\s+([^,]++),\s*so\s+that\s+(.+)', re.IGNORECASE)
+    for verb in ('want', 'need', r'should\s+be\s+able\s+to')
+)
+
+# Story formats that satisfy the DoR user story requirement
+_USER_STORY_FORMAT_RE = re.compile(r'as\s+(?:a\s+)?[^,]++,\s*i\s+(?:want|need)\s+[^,]++,\s*so\s+that\s+.+', re.IGNORECASE)
+
+# First description line holding both "As a" and "I want", found without splitting the text into lines
+_STORY_LINE_RE = re.compile(r'^(?=[^\n]*As a)(?=[^\n]*I want)[^\n]*', re.MULTILINE)
+
+# Story component cues for tickets without an "As a ... I want ... so that" sentence; tuple order is match priority
+_PERSONA_INDICATORS = ('user', 'customer', 'admin', 'developer', 'tester', 'manager')
+_GOAL_INDICATORS = ('want', 'need', 'should', 'able to', 'can')
+_BENEFIT_INDICATORS = ('so that', 'in order to', 'because', 'to')
+
+# Each persona indicator is its own group so the first one in priority order can be picked from the hits
+_STORY_COMPONENT_GROUPS = {
+    **{indicator: frozenset({indicator}) for indicator in _PERSONA_INDICATORS},
+    'goal': frozenset(_GOAL_INDICATORS),
+    'benefit': frozenset(_BENEFIT_INDICATORS)
+}
+_STORY_COMPONENT_AUTOMATON = _build_group_automaton(_STORY_COMPONENT_GROUPS)
+
+# Technical keywords worth 10 points each in the technical score
+_TECH_SCORE_KEYWORDS = ('api', 'database', 'security', 'performance', 'integration', 'architecture')
+
+# Leading separators (":", "-", whitespace) trimmed from extracted bug report sections
+_SECTION_LEAD_RE = re.compile(r'^[:\-\s]+')
+
+# Acceptance criteria section headings embedded in ticket descriptions (see _find_ac_sections)
+_AC_SECTION_HEADINGS = (
+    re.compile(r'Acceptance Criteria[:\s]*', re.IGNORECASE),
+    re.compile(r'AC[:\s]*', re.IGNORECASE),
+)
+
+# Given/When/Then blocks are located keyword by keyword (see _find_given_when_then)
+_GIVEN_RE = re.compile(r'Given', re.IGNORECASE)
+_WHEN_RE = re.compile(r'When', re.IGNORECASE)
+_THEN_RE = re.compile(r'Then', re.IGNORECASE)
+_AC_BOUNDARY_RE = re.compile(r'(?=\n\n|\n[A-Z]|$)', re.IGNORECASE)
+
+
+def _find_given_when_then(text: str) -> List[str]:
+    """Find Given...When...Then blocks, equivalent to findall(r'Given.*?When.*?Then.*?(?=...)').
+
+    The regex form retries from every later 'Given' when no 'When'/'Then' follows,
+    which is quadratic on long descriptions; a missing keyword here ends the scan.
+    """
+    blocks = []
+    pos = 0
+    while True:
+        given = _GIVEN_RE.search(text, pos)
+        if not given:
+            break
+        when = _WHEN_RE.search(text, given.end())
+        if not when:
+            break
+        then = _THEN_RE.search(text, when.end())
+        if not then:
+            break
+        pos = _AC_BOUNDARY_RE.search(text, then.end()).start()
+        blocks.append(text[given.start():pos])
+    return blocks
+
+
+def _find_ac_sections(heading: re.Pattern, text: str) -> List[str]:
+    """Find heading-led sections, equivalent to findall(heading + r'(.*?)(?=...)', DOTALL).
+
+    Each section is cut at the next boundary with one anchored search instead of
+    testing the lookahead after every lazily consumed character.
+    """
+    sections = []
+    pos = 0
+    while True:
+        match = heading.search(text, pos)
+        if not match:
+            break
+        pos = _AC_BOUNDARY_RE.search(text, match.end()).start()
+        sections.append(text[match.end():pos])
+    return sections
+
+
+@lru_cache(maxsize=64)
+def _description_ac_sections(description: str) -> Tuple[str, ...]:
+    """Parse the AC sections and Given/When/Then blocks out of a description once per distinct text"""
+    sections = []
+    for heading in _AC_SECTION_HEADINGS:
+        sections.extend(_stripped_nonblank(_find_ac_sections(heading, description)))
+    sections.extend(_stripped_nonblank(_find_given_when_then(description)))
+    return tuple(sections)
+
+# Test scenario categories in one zero-width scan so overlapping keywords are all seen;
+# 'edge case' counts towards both negative and risk-based (edge) coverage. The leading
+# class holds every keyword's first letter so most positions are rejected by one bitmap test.
+_TEST_CATEGORY_RE = re.compile(
+    r'(?=[befhnprs])'
+    r'(?=(?P<negative_rbt>edge case)'
+    r'|(?P<positive>positive|happy path|success|normal)'
+    r'|(?P<negative>negative|error|failure)'
+    r'|(?P<rbt>risk|boundary|edge|exception))',
+    re.IGNORECASE
+)
+_TEST_CATEGORY_GROUPS = {
+    'positive': ('positive',),
+    'negative': ('negative',),
+    'rbt': ('rbt',),
+    'negative_rbt': ('negative', 'rbt')
+}
+
+# Required test scenario categories -> (missing-scenario recommendation, test plan recommendation)
+_REQUIRED_TEST_SCENARIOS = {
+    'positive': ("Define positive test scenario for: {summary}",
+                 "Add positive test scenario covering the main user journey"),
+    'negative': ("Define negative test scenarios including error handling and edge cases",
+                 "Add negative test scenarios for error handling and edge cases"),
+    'rbt': ("Define risk-based test scenarios focusing on high-impact failure points",
+            "Add risk-based test scenarios for high-impact failure points")
+}
+
+# Target word-count range per output mode for apply_length_guardrails
+_LENGTH_TARGET_RANGES = {
+    "actionable": (300, 600),
+    "insight": (180, 350),
+    "summary": (120, 180)
+}
+
+# Focus instructions per groom level, served by get_groom_level_prompt
+_GROOM_LEVEL_PROMPTS = {
+    'updated': """Provide an updated analysis focusing on:
+1. Current sprint readiness
+2. Recent changes and updates
+3. Priority actions for immediate implementation
+4. Team collaboration points""",
+    
+    'strict': """Provide a strict analysis focusing on:
+1. Definition of Ready compliance
+2. Missing critical elements
+3. Quality standards adherence
+4. Risk assessment and mitigation""",
+    
+    'light': """Provide a light analysis focusing on:
+1. Key gaps and missing elements
+2. Top 3 priority actions
+3. Sprint readiness assessment
+4. Quick wins and improvements""",
+    
+    'default': """Provide a comprehensive analysis including:
+1. Detailed DOR assessment
+2. Acceptance criteria improvements
+3. Test scenario recommendations
+4. Framework alignment
+5. Brand-specific considerations
+6. Sprint readiness with specific next steps""",
+    
+    'insight': """Provide an insightful analysis focusing on:
+1. Business value and impact
+2. User experience considerations
+3. Technical complexity assessment
+4. Cross-team dependencies
+5. Strategic alignment""",
+    
+    'deep_dive': """Provide a deep dive analysis including:
+1. Comprehensive DOR analysis
+2. Detailed acceptance criteria review
+3. Extensive test scenario planning
+4. Framework alignment assessment
+5. Brand and component analysis
+6. Risk and dependency mapping
+7. Sprint planning recommendations""",
+    
+    'actionable': """Provide an actionable analysis focusing on:
+1. Specific next steps with owners
+2. Timeline and priority recommendations
+3. Resource requirements
+4. Success criteria and metrics
+5. Implementation roadmap""",
+    
+    'summary': """Provide a summary analysis including:
+1. Executive summary of readiness
+2. Key metrics and scores
+3. Critical gaps and blockers
+4. Recommended actions
+5. Timeline estimates"""
+}
+
+# Returned by get_fallback_groom_analysis on every error path
+_FALLBACK_GROOM_ANALYSIS = """# Groom Room Analysis - Service Unavailable
+
+**Status:** Analysis services are currently unavailable.
+
+**Please check:**
+- Azure OpenAI configuration
+- Jira integration status
+- Network connectivity
+
+**Manual Review Checklist:**
+- [ ] Clear summary and description
+- [ ] Acceptance criteria defined
+- [ ] Test scenarios identified
+- [ ] Story points estimated
+- [ ] Team assigned
+- [ ] Dependencies identified
+
+Please try again or contact support if the issue persists."""
+
+# Pasted content shorter than this (after stripping) is not worth grooming
+_MIN_TICKET_CONTENT_CHARS = 32
+
+_INSUFFICIENT_CONTENT_ANALYSIS = """# Groom Room Analysis - Insufficient Content
+
+**Status:** The ticket content is too short to analyze.
+
+**Please add:**
+- A summary and description of the change
+- Acceptance criteria
+- Test scenarios
+
+Paste the full ticket content or a Jira ticket key and try again."""
+
+# LLM groom analysis prompt; placeholders are parsed once at import
+_ANALYSIS_PROMPT_TEMPLATE = Template("""You are a professional Jira ticket analyst. Analyze this ticket and provide a comprehensive groom analysis.
+
+TICKET SUMMARY:
+- Key: $key
+- Summary: $summary
+- Type: $issue_type
+- Status: $status
+- Assignee: $assignee
+- Story Points: $story_points
+- Agile Team: $agile_team
+
+DEFINITION OF READY ANALYSIS:
+- Coverage: $dor_coverage%
+- Present: $dor_present
+- Missing: $dor_missing
+
+SPRINT READINESS:
+- Score: $readiness_score/100
+- Status: $readiness_status
+
+ACCEPTANCE CRITERIA REVIEW:
+$ac_review
+TEST ANALYSIS:
+- Coverage: $test_coverage%
+- Missing Scenarios: $missing_scenarios
+
+GAPS IDENTIFIED:
+$gaps
+
+NEXT ACTIONS:
+$next_actions
+
+$instructions""")
+
+_LIGHT_ANALYSIS_INSTRUCTIONS = """Provide a concise analysis focusing on:
+1. Key gaps and missing elements
+2. Top 3 priority actions
+3. Sprint readiness assessment
+Keep response under 500 words."""
+
+_FULL_ANALYSIS_INSTRUCTIONS = """Provide a comprehensive analysis including:
+1. Detailed DOR assessment
+2. Acceptance criteria improvements
+3. Test scenario recommendations
+4. Framework alignment
+5. Brand-specific considerations
+6. Sprint readiness with specific next steps
+Use markdown formatting with clear headings."""
+
+# Levels whose prompt summarizes the AC review instead of listing every critique/rewrite
+_COMPACT_PROMPT_LEVELS = frozenset({'summary'})
+_COMPACT_AC_REVIEW = "\n- {count} acceptance criteria reviewed; weak ones are counted under GAPS IDENTIFIED\n"
+
+# Final-analysis instructions per level; the full six-section report suits only the full token
+# budget, so length-targeted levels get their own focus and word limit (this also keeps levels
+# with a compacted AC review from being asked for AC improvements)
+_LEVEL_ANALYSIS_INSTRUCTIONS = {
+    'light': _LIGHT_ANALYSIS_INSTRUCTIONS,
+    **{
+        level: f"{_GROOM_LEVEL_PROMPTS[level]}\nKeep response under {max_words} words."
+        for level, (_, max_words) in _LENGTH_TARGET_RANGES.items()
+    }
+}
+
+# Row accessors for AC review entries and missing test scenarios in the structured output
+_AC_REVIEW_FIELDS = itemgetter('original', 'critique', 'revised')
+_SCENARIO_FIELDS = itemgetter('type', 'description')
+
+# Completion token cap for levels whose instructions set a word limit; levels asked for the full
+# report keep the 2000-token budget
+_FINAL_ANALYSIS_MAX_TOKENS = {
+    'summary': 350,
+    'insight': 600,
+    'actionable': 900,
+    'light': 1200
+}
+
+# Worker threads shared by the analyzer pipeline; only the CPU-bound analyzers run here
+# (see _run_analyzers), so a small pool is not held up by Azure OpenAI round-trips
+_ANALYSIS_WORKERS = 4
+
+# Analyzer pool shared by every GroomRoom instance; app.py builds one per request, so a
+# per-instance pool would leak threads until the instance's reference cycles are collected
+_ANALYSIS_EXECUTOR = None
+_ANALYSIS_EXECUTOR_LOCK = threading.Lock()
+
+
+def _analysis_executor() -> ThreadPoolExecutor:
+    """Return the process-wide analyzer pool, creating it on first use"""
+    global _ANALYSIS_EXECUTOR
+    with _ANALYSIS_EXECUTOR_LOCK:
+        if _ANALYSIS_EXECUTOR is None:
+            _ANALYSIS_EXECUTOR = ThreadPoolExecutor(max_workers=_ANALYSIS_WORKERS, thread_name_prefix='groomroom')
+    return _ANALYSIS_EXECUTOR
+
+
+# Set on threads that groom one ticket of a batch; batches already run tickets in parallel
+_batch_worker = threading.local()
+
+# Per-thread memo of flattened ADF bodies, set up for the duration of one extract_jira_fields call
+_adf_memo = threading.local()
+
+
+def _as_batch_worker(fn, *args):
+    """Call fn on a batch thread, with the analyzers it starts run inline"""
+    _batch_worker.active = True
+    try:
+        return fn(*args)
+    finally:
+        _batch_worker.active = False
+
+
+def _run_analyzers(llm_call, *calls) -> List[Any]:
+    """Run (fn, *args) analyzer calls and return their results in call order.
+
+    llm_call is the analyzer that waits on the LLM; it runs on the calling thread so a
+    slow round-trip never holds a worker that other requests share. The remaining calls
+    overlap with it on the shared pool, except on batch threads: there the batch already
+    supplies the parallelism, and queueing behind other tickets' analyzers would only block.
+    """
+    if getattr(_batch_worker, 'active', False):
+        return [fn(*args) for fn, *args in (llm_call, *calls)]
+    submit = _analysis_executor().submit
+    futures = [submit(fn, *args) for fn, *args in calls]
+    fn, *args = llm_call
+    first = fn(*args)
+    return [first, *(future.result() for future in futures)]
+
+
+def _event_loop_running() -> bool:
+    """Whether this thread is already running an asyncio event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+# Tickets groomed concurrently by generate_groom_analysis_batch and analyze_batch_tickets
+_BATCH_CONCURRENCY = 8
+
+# Hardcoded Jira field IDs used by _get_field_value when no dynamic field mapper is available
+_FALLBACK_FIELD_IDS = {
+    'Acceptance Criteria': 'customfield_10017',
+    'Test Scenarios': 'customfield_10018',
+    'Story Points': 'customfield_10016',
+    'Agile Team': 'customfield_10020'
+}
+
+# Maximum number of groom analyses kept across GroomRoom instances
+_GROOM_CACHE_SIZE = 256
+
+# Maximum number of story analyses (and their LLM rewrites) kept across GroomRoom instances
+_STORY_CACHE_SIZE = 256
+
+# Maximum number of acceptance criteria audits (and their LLM rewrites) kept across GroomRoom instances
+_AC_AUDIT_CACHE_SIZE = 256
+
+
+def _cache_get(cache: OrderedDict, lock: threading.Lock, key: Any) -> Any:
+    """Return a cached value and mark it most recently used, or None on a miss"""
+    with lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict, lock: threading.Lock, key: Any, value: Any, maxsize: int) -> None:
+    """Store a value, evicting the least recently used entry once the cache is full"""
+    with lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+
+
+# Memoized results live at module level because app.py builds a GroomRoom per request;
+# batch grooming reads and writes them from worker threads, hence the locks
+_GROOM_CACHE = OrderedDict()
+_GROOM_CACHE_LOCK = threading.Lock()
+_STORY_CACHE = OrderedDict()
+_STORY_CACHE_LOCK = threading.Lock()
+_AC_AUDIT_CACHE = OrderedDict()
+_AC_AUDIT_CACHE_LOCK = threading.Lock()
+
+# Framework element indicator keywords, scanned in one pass per ticket
+_FRAMEWORK_INDICATORS = {
+    'roi': {
+        'readiness': ['ready', 'complete', 'defined', 'clear', 'prepared'],
+        'objectives': ['goal', 'objective', 'purpose', 'aim', 'target'],
+        'implementation': ['implement', 'develop', 'build', 'create', 'deliver']
+    },
+    'invest': {
+        'independent': ['standalone', 'independent', 'separate', 'isolated'],
+        'negotiable': ['flexible', 'negotiable', 'adjustable', 'modifiable'],
+        'valuable': ['value', 'benefit', 'worth', 'important', 'useful'],
+        'estimable': ['estimate', 'size', 'effort', 'complexity', 'points'],
+        'small': ['small', 'manageable', 'focused', 'specific'],
+        'testable': ['test', 'verify', 'validate', 'check', 'confirm']
+    },
+    'accept': {
+        'actionable': ['action', 'do', 'perform', 'execute', 'complete'],
+        'clear': ['clear', 'specific', 'defined', 'explicit'],
+        'complete': ['complete', 'comprehensive', 'full', 'entire'],
+        'edge-case aware': ['edge', 'exception', 'error', 'boundary', 'limit'],
+        'precise': ['precise', 'exact', 'specific', 'detailed']
+    },
+    '3c': {
+        'card': ['card', 'ticket', 'story', 'task', 'issue'],
+        'conversation': ['discuss', 'talk', 'meeting', 'review', 'refinement'],
+        'confirmation': ['confirm', 'verify', 'accept', 'approve', 'sign-off']
+    }
+}
+
 class GroomRoom:
     """AI-driven GroomRoom Refinement Agent for comprehensive Jira ticket analysis and refinement"""
     
     def __init__(self):
         self.client = None
+        self.async_client = None
+        self._deployment_name = None
         self.jira_integration = None
         self.field_mapper = None
+        self._indicator_automaton = self._build_indicator_automaton()
         self.setup_azure_openai()
         
         # Initialize Jira integration after Azure OpenAI to avoid blocking
@@ -56,6 +759,12 @@ class GroomRoom:
             'ELF': 'PWA (Progressive Web App) for YCC and MMT only',
             'EMEA': 'Yankee brand regions only (IE, FR, IT, DE, GB)'
         }
+        # Lowercased, interned brand tokens so per-ticket lookups reuse one hashed key each
+        self._brand_tokens = [
+            (sys.intern(brand.lower()), brand, description)
+            for brand, description in self.brand_abbreviations.items()
+        ]
+        self._brand_token_set = frozenset(brand_token for brand_token, _, _ in self._brand_tokens)
         
         # Enhanced Framework definitions for comprehensive analysis
         self.frameworks = {
@@ -84,6 +793,11 @@ class GroomRoom:
                 'max_score': 10
             }
         }
+        # Element search patterns per framework, compiled once for _analyze_framework_alignment
+        self._framework_element_patterns = {
+            framework_key: [(element, re.compile(element.lower(), re.IGNORECASE)) for element in framework_info['elements']]
+            for framework_key, framework_info in self.frameworks.items()
+        }
         
         # Enhanced Definition of Ready (DoR) requirements with weighted scoring
         self.dor_requirements = {
@@ -131,6 +845,17 @@ class GroomRoom:
             }
         }
         
+        # DoR requirement key -> presence check
+        self._dor_checks = {
+            'user_story': self._check_user_story_requirement,
+            'acceptance_criteria': self._check_acceptance_criteria_requirement,
+            'testing_steps': self._check_testing_steps_requirement,
+            'implementation_details': self._check_implementation_details,
+            'architectural_solution': self._check_architectural_solution,
+            'ada_criteria': self._check_ada_criteria,
+            'additional_fields': self._check_additional_fields
+        }
+        
         # Enhanced card types with specific validation rules
         self.card_types = {
             'user_story': {
@@ -218,10 +943,13 @@ class GroomRoom:
             endpoint = os.getenv('AZURE_OPENAI_ENDPOINT')
             api_key = os.getenv('AZURE_OPENAI_API_KEY')
             deployment_name = os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME')
+            # Read once per instance; every completion call reuses it
+            self._deployment_name = deployment_name
             
             if not all([endpoint, api_key, deployment_name]):
                 console.print("[yellow]Azure OpenAI credentials not fully configured[/yellow]")
                 self.client = None
+                self.async_client = None
                 return
                 
             self.client = openai.AzureOpenAI(
@@ -229,11 +957,18 @@ class GroomRoom:
                 api_key=api_key,
                 api_version="2024-02-15-preview"
             )
+            # Async client lets batch grooming overlap LLM round-trips
+            self.async_client = openai.AsyncAzureOpenAI(
+                azure_endpoint=endpoint,
+                api_key=api_key,
+                api_version="2024-02-15-preview"
+            )
             console.print("[green]✅ Azure OpenAI client initialized successfully[/green]")
             
         except Exception as e:
             console.print(f"[red]❌ Failed to initialize Azure OpenAI client: {e}[/red]")
             self.client = None
+            self.async_client = None
 
     def _format_field_names(self, field_keys: List[str]) -> str:
         """Convert field keys to human-readable labels"""
@@ -247,15 +982,15 @@ class GroomRoom:
                 readable_names.append(self.dor_requirements[key]['name'])
             else:
                 # Fallback: convert underscores to spaces and title case
-                readable_names.append(key.replace('_', ' ').title())
+                readable_names.append(_field_label(key))
         
         return ', '.join(readable_names)
 
     def detect_card_type(self, issue_data: Dict[str, Any]) -> Dict[str, Any]:
         """Auto-detect card type and apply refinement rules"""
-        issue_type = issue_data.get('issue_type', '').lower()
-        summary = issue_data.get('summary', '').lower()
-        description = issue_data.get('description', '').lower()
+        issue_type = _lower(issue_data.get('issue_type', ''))
+        summary = _lower(issue_data.get('summary', ''))
+        description = _lower(issue_data.get('description', ''))
         
         # Detection logic based on issue type and content
         if 'bug' in issue_type or 'defect' in issue_type:
@@ -267,12 +1002,17 @@ class GroomRoom:
         elif 'feature' in issue_type or 'epic' in issue_type:
             detected_type = 'feature'
         else:
-            # Content-based detection
-            if any(keyword in summary + description for keyword in ['as a', 'i want', 'so that']):
+            # Content-based detection: one keyword scan, story cues outrank bug cues outrank task cues
+            found_types = set()
+            for match in _CARD_TYPE_KEYWORD_RE.finditer(summary + description):
+                found_types.add(match.lastgroup)
+                if match.lastgroup == 'user_story':
+                    break
+            if 'user_story' in found_types:
                 detected_type = 'user_story'
-            elif any(keyword in summary + description for keyword in ['bug', 'error', 'broken', 'not working']):
+            elif 'bug' in found_types:
                 detected_type = 'bug'
-            elif any(keyword in summary + description for keyword in ['task', 'config', 'documentation']):
+            elif 'task' in found_types:
                 detected_type = 'task'
             else:
                 detected_type = 'user_story'  # Default fallback
@@ -292,60 +1032,53 @@ class GroomRoom:
         description = issue_data.get('description', '')
         summary = issue_data.get('summary', '')
         
-        # Look for user story patterns
-        user_story_patterns = [
-            r'as\s+(?:a\s+)?([^,]+),\s*i\s+want\s+([^,]+),\s*so\s+that\s+(.+)',
-            r'as\s+(?:a\s+)?([^,]+),\s*i\s+need\s+([^,]+),\s*so\s+that\s+(.+)',
-            r'as\s+(?:a\s+)?([^,]+),\s*i\s+should\s+be\s+able\s+to\s+([^,]+),\s*so\s+that\s+(.+)'
-        ]
+        # Re-analyzing the same story (e.g. once per output mode) reuses the result and its LLM rewrite
+        cache_key = hashlib.blake2b(f"{self.client is not None}\0{summary}\0{description}".encode('utf-8'), digest_size=16).hexdigest()
+        cached = _cache_get(_STORY_CACHE, _STORY_CACHE_LOCK, cache_key)
+        if cached is not None:
+            return dict(cached)
         
+        # Look for user story patterns
         detected_persona = None
         detected_goal = None
         detected_benefit = None
         story_quality_score = 0
         
-        for pattern in user_story_patterns:
-            match = re.search(pattern, description + ' ' + summary, re.IGNORECASE)
-            if match:
-                detected_persona = match.group(1).strip()
-                detected_goal = match.group(2).strip()
-                detected_benefit = match.group(3).strip()
-                story_quality_score = 80  # Good structure found
-                break
+        content = description + ' ' + summary
+        # One scan rules out story-less content; on a hit the per-verb patterns pick the
+        # sentence by verb priority rather than position
+        match = _USER_STORY_RE.search(content)
+        if match:
+            match = next(filter(None, (pattern.search(content) for pattern in _USER_STORY_PATTERNS)), match)
+        if match:
+            detected_persona = match.group(1).strip()
+            detected_goal = match.group(2).strip()
+            detected_benefit = match.group(3).strip()
+            story_quality_score = 80  # Good structure found
         
         # If no clear pattern found, analyze content for components
         if not detected_persona:
             story_quality_score = 20
             # Try to extract components from content
-            content = description + ' ' + summary
-            
-            # Look for persona indicators
-            persona_indicators = ['user', 'customer', 'admin', 'developer', 'tester', 'manager']
-            for indicator in persona_indicators:
-                if indicator in content.lower():
-                    detected_persona = indicator
-                    break
+            content_lower = _lower(content)
             
-            # Look for goal indicators
-            goal_indicators = ['want', 'need', 'should', 'able to', 'can']
-            for indicator in goal_indicators:
-                if indicator in content.lower():
-                    detected_goal = content[:100] + '...' if len(content) > 100 else content
-                    break
+            # Persona, goal and benefit indicators found in one pass over the content
+            hits = _scan_groups(_STORY_COMPONENT_AUTOMATON, _STORY_COMPONENT_GROUPS, content_lower)
+            detected_persona = next((indicator for indicator in _PERSONA_INDICATORS if indicator in hits), None)
             
-            # Look for benefit indicators
-            benefit_indicators = ['so that', 'in order to', 'because', 'to']
-            for indicator in benefit_indicators:
-                if indicator in content.lower():
-                    detected_benefit = content[:100] + '...' if len(content) > 100 else content
-                    break
+            # Goal and benefit both fall back to a content excerpt
+            excerpt = content[:100] + '...' if len(content) > 100 else content
+            if 'goal' in hits:
+                detected_goal = excerpt
+            if 'benefit' in hits:
+                detected_benefit = excerpt
         
         # Generate story rewrite if needed
         story_rewrite = None
         if story_quality_score < 70 and self.client:
             story_rewrite = self._generate_story_rewrite(description, summary, detected_persona, detected_goal, detected_benefit)
         
-        return {
+        story_analysis = {
             'detected_persona': detected_persona,
             'detected_goal': detected_goal,
             'detected_benefit': detected_benefit,
@@ -356,6 +1089,10 @@ class GroomRoom:
             'has_goal': bool(detected_goal),
             'has_benefit': bool(detected_benefit)
         }
+        
+        # Values are immutable, so a shallow copy keeps callers from editing the cached entry
+        _cache_put(_STORY_CACHE, _STORY_CACHE_LOCK, cache_key, story_analysis, _STORY_CACHE_SIZE)
+        return dict(story_analysis)
 
     def audit_acceptance_criteria(self, acceptance_criteria: List[str]) -> Dict[str, Any]:
         """Detect vague, missing, or non-testable ACs and rewrite them"""
@@ -367,6 +1104,12 @@ class GroomRoom:
                 'coverage_analysis': 'No acceptance criteria found'
             }
         
+        # Re-auditing the same ACs (e.g. when only ticket metadata changed) reuses the result and its LLM rewrites
+        cache_key = hashlib.blake2b('\0'.join((str(self.client is not None), *acceptance_criteria)).encode('utf-8'), digest_size=16).hexdigest()
+        cached = _cache_get(_AC_AUDIT_CACHE, _AC_AUDIT_CACHE_LOCK, cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         ac_analysis = []
         weak_count = 0
         
@@ -399,7 +1142,7 @@ class GroomRoom:
         if len(acceptance_criteria) < 3 and self.client:
             additional_acs = self._generate_additional_acs(acceptance_criteria)
         
-        return {
+        audit = {
             'detected': len(acceptance_criteria),
             'weak': weak_count,
             'suggested_rewrite': [ac['suggested_rewrite'] for ac in ac_analysis if ac['suggested_rewrite']],
@@ -407,6 +1150,10 @@ class GroomRoom:
             'detailed_analysis': ac_analysis,
             'additional_suggestions': additional_acs
         }
+        
+        # The audit nests lists and dicts, so callers always get a deep copy of the cached entry
+        _cache_put(_AC_AUDIT_CACHE, _AC_AUDIT_CACHE_LOCK, cache_key, audit, _AC_AUDIT_CACHE_SIZE)
+        return copy.deepcopy(audit)
 
     def generate_test_scenarios(self, issue_data: Dict[str, Any]) -> List[str]:
         """Generate Positive, Negative, and Error test scenarios"""
@@ -471,11 +1218,11 @@ class GroomRoom:
         framework_score = sum(framework_scores.values()) / len(framework_scores) if framework_scores else 0
         
         # Calculate weighted total
-        total_score = (
-            dor_score * self.readiness_weights['dor_completion'] +
-            framework_score * self.readiness_weights['framework_quality'] +
-            technical_coverage * self.readiness_weights['technical_test_coverage']
-        )
+        weights = self.readiness_weights
+        dor_weighted = dor_score * weights['dor_completion']
+        framework_weighted = framework_score * weights['framework_quality']
+        technical_weighted = technical_coverage * weights['technical_test_coverage']
+        total_score = dor_weighted + framework_weighted + technical_weighted
         
         # Determine status
         status_info = None
@@ -491,9 +1238,9 @@ class GroomRoom:
             'framework_score': framework_score,
             'technical_score': technical_coverage,
             'breakdown': {
-                'dor_weighted': dor_score * self.readiness_weights['dor_completion'],
-                'framework_weighted': framework_score * self.readiness_weights['framework_quality'],
-                'technical_weighted': technical_coverage * self.readiness_weights['technical_test_coverage']
+                'dor_weighted': dor_weighted,
+                'framework_weighted': framework_weighted,
+                'technical_weighted': technical_weighted
             }
         }
 
@@ -503,41 +1250,32 @@ class GroomRoom:
             return self.field_mapper.get_field_value(issue_fields, field_name)
         else:
             # Fallback to hardcoded field IDs
-            fallback_fields = {
-                'Acceptance Criteria': 'customfield_10017',
-                'Test Scenarios': 'customfield_10018', 
-                'Story Points': 'customfield_10016',
-                'Agile Team': 'customfield_10020'
-            }
-            field_id = fallback_fields.get(field_name)
+            field_id = _FALLBACK_FIELD_IDS.get(field_name)
             return issue_fields.get(field_id) if field_id else None
 
     def _analyze_ac_quality(self, ac: str) -> int:
         """Analyze acceptance criteria quality and return score (0-100)"""
         score = 0
+        hits = _ac_quality_hits(_lower(ac))
         
         # Check for clarity indicators
         if len(ac.strip()) > 20:
             score += 20
         
         # Check for testability indicators
-        testable_words = ['verify', 'check', 'confirm', 'validate', 'ensure', 'should', 'must', 'will']
-        if any(word in ac.lower() for word in testable_words):
+        if 'testable' in hits:
             score += 25
         
         # Check for specificity (avoid vague words)
-        vague_words = ['good', 'nice', 'better', 'improved', 'enhanced', 'user-friendly']
-        if not any(word in ac.lower() for word in vague_words):
+        if 'vague' not in hits:
             score += 20
         
         # Check for business intent vs technical solution
-        technical_words = ['click', 'button', 'api', 'database', 'code', 'function']
-        if not any(word in ac.lower() for word in technical_words):
+        if 'technical' not in hits:
             score += 15
         
         # Check for measurable outcomes
-        measurable_words = ['display', 'show', 'appear', 'contain', 'include', 'have']
-        if any(word in ac.lower() for word in measurable_words):
+        if 'measurable' in hits:
             score += 20
         
         return min(score, 100)
@@ -545,17 +1283,18 @@ class GroomRoom:
     def _identify_ac_issues(self, ac: str) -> List[str]:
         """Identify specific issues with acceptance criteria"""
         issues = []
+        hits = _ac_quality_hits(_lower(ac))
         
         if len(ac.strip()) < 20:
             issues.append("Too short - needs more detail")
         
-        if not any(word in ac.lower() for word in ['verify', 'check', 'confirm', 'validate', 'ensure']):
+        if 'testable_issue' not in hits:
             issues.append("Not clearly testable")
         
-        if any(word in ac.lower() for word in ['good', 'nice', 'better', 'improved']):
+        if 'vague_issue' in hits:
             issues.append("Contains vague language")
         
-        if any(word in ac.lower() for word in ['click', 'button', 'api', 'database']):
+        if 'technical_issue' in hits:
             issues.append("Focuses on how rather than what")
         
         return issues
@@ -580,7 +1319,7 @@ Provide a single, improved user story in the format: "As a [persona], I want [go
 Focus on clarity, business value, and measurability."""
 
             response = self.client.chat.completions.create(
-                model=os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME'),
+                model=self._deployment_name,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
                 max_tokens=200
@@ -610,7 +1349,7 @@ Requirements:
 Provide a single, improved acceptance criteria:"""
 
             response = self.client.chat.completions.create(
-                model=os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME'),
+                model=self._deployment_name,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
                 max_tokens=200
@@ -641,7 +1380,7 @@ Focus on:
 Provide 2-3 additional acceptance criteria:"""
 
             response = self.client.chat.completions.create(
-                model=os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME'),
+                model=self._deployment_name,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
                 max_tokens=300
@@ -649,7 +1388,7 @@ Provide 2-3 additional acceptance criteria:"""
             
             # Parse response into list
             content = response.choices[0].message.content.strip()
-            return [line.strip() for line in content.split('\n') if line.strip() and not line.strip().startswith(('1.', '2.', '3.', '-', '*'))]
+            return [line for line in map(str.strip, content.splitlines()) if line and not line.startswith(('1.', '2.', '3.', '-', '*'))]
             
         except Exception as e:
             return []
@@ -671,14 +1410,14 @@ Provide 3-5 test scenarios covering:
 Format each as: "Type: Description" (e.g., "Positive: Verify user can login with valid credentials")"""
 
             response = self.client.chat.completions.create(
-                model=os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME'),
+                model=self._deployment_name,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
                 max_tokens=400
             )
             
             content = response.choices[0].message.content.strip()
-            return [line.strip() for line in content.split('\n') if line.strip()]
+            return _stripped_nonblank(content.splitlines())
             
         except Exception as e:
             return self._generate_rule_based_test_scenarios(summary, description, acceptance_criteria)
@@ -702,21 +1441,20 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
 
     def _extract_bug_component(self, content: str, keywords: List[str]) -> Optional[str]:
         """Extract bug report component based on keywords"""
-        content_lower = content.lower()
+        content_lower = _lower(content)
         
         for keyword in keywords:
-            if keyword in content_lower:
-                # Find the section after the keyword
-                start_idx = content_lower.find(keyword)
-                if start_idx != -1:
-                    # Extract text after keyword until next section or end
-                    section_start = start_idx + len(keyword)
-                    section_text = content[section_start:section_start + 200].strip()
-                    
-                    # Clean up the text
-                    section_text = re.sub(r'^[:\-\s]+', '', section_text)
-                    if section_text:
-                        return section_text[:150] + '...' if len(section_text) > 150 else section_text
+            # Find the section after the keyword
+            start_idx = content_lower.find(keyword)
+            if start_idx != -1:
+                # Extract text after keyword until next section or end
+                section_start = start_idx + len(keyword)
+                section_text = content[section_start:section_start + 200].strip()
+                
+                # Clean up the text
+                section_text = _SECTION_LEAD_RE.sub('', section_text)
+                if section_text:
+                    return section_text[:150] + '...' if len(section_text) > 150 else section_text
         
         return None
 
@@ -726,6 +1464,9 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         acceptance_criteria = issue_data.get('acceptance_criteria', [])
         
         framework_scores = {}
+        ac_text_lower = _lower(' '.join(acceptance_criteria))
+        combined_text = content.lower() + ' ' + ac_text_lower
+        hits = self._scan_indicators(combined_text)
         
         for framework_key, framework_info in self.frameworks.items():
             elements = framework_info['elements']
@@ -733,7 +1474,7 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
             found_elements = []
             
             for element in elements:
-                if self._check_framework_element(element, content, acceptance_criteria, framework_key):
+                if self._check_framework_element(element, hits, ac_text_lower, framework_key):
                     found_elements.append(element)
             
             # Calculate score based on found elements
@@ -742,75 +1483,46 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         
         return framework_scores
 
-    def _check_framework_element(self, element: str, content: str, acceptance_criteria: List[str], framework_key: str) -> bool:
-        """Check if a framework element is present in the content"""
-        content_lower = content.lower()
-        ac_text = ' '.join(acceptance_criteria).lower()
-        combined_text = content_lower + ' ' + ac_text
-        
-        # Framework-specific element checking
-        if framework_key == 'roi':
-            return self._check_roi_element(element, combined_text)
-        elif framework_key == 'invest':
-            return self._check_invest_element(element, combined_text)
-        elif framework_key == 'accept':
-            return self._check_accept_element(element, combined_text, acceptance_criteria)
-        elif framework_key == '3c':
-            return self._check_3c_element(element, combined_text)
-        
-        return False
-
-    def _check_roi_element(self, element: str, content: str) -> bool:
-        """Check ROI framework elements"""
-        roi_indicators = {
-            'readiness': ['ready', 'complete', 'defined', 'clear', 'prepared'],
-            'objectives': ['goal', 'objective', 'purpose', 'aim', 'target'],
-            'implementation': ['implement', 'develop', 'build', 'create', 'deliver']
-        }
-        
-        indicators = roi_indicators.get(element.lower(), [])
-        return any(indicator in content for indicator in indicators)
-
-    def _check_invest_element(self, element: str, content: str) -> bool:
-        """Check INVEST framework elements"""
-        invest_indicators = {
-            'independent': ['standalone', 'independent', 'separate', 'isolated'],
-            'negotiable': ['flexible', 'negotiable', 'adjustable', 'modifiable'],
-            'valuable': ['value', 'benefit', 'worth', 'important', 'useful'],
-            'estimable': ['estimate', 'size', 'effort', 'complexity', 'points'],
-            'small': ['small', 'manageable', 'focused', 'specific'],
-            'testable': ['test', 'verify', 'validate', 'check', 'confirm']
-        }
-        
-        indicators = invest_indicators.get(element.lower(), [])
-        return any(indicator in content for indicator in indicators)
-
-    def _check_accept_element(self, element: str, content: str, acceptance_criteria: List[str]) -> bool:
-        """Check ACCEPT framework elements"""
-        if element.lower() == 'testable':
-            return len(acceptance_criteria) > 0 and any('verify' in ac.lower() or 'check' in ac.lower() for ac in acceptance_criteria)
-        
-        accept_indicators = {
-            'actionable': ['action', 'do', 'perform', 'execute', 'complete'],
-            'clear': ['clear', 'specific', 'defined', 'explicit'],
-            'complete': ['complete', 'comprehensive', 'full', 'entire'],
-            'edge-case aware': ['edge', 'exception', 'error', 'boundary', 'limit'],
-            'precise': ['precise', 'exact', 'specific', 'detailed']
-        }
-        
-        indicators = accept_indicators.get(element.lower(), [])
-        return any(indicator in content for indicator in indicators)
-
-    def _check_3c_element(self, element: str, content: str) -> bool:
-        """Check 3C framework elements"""
-        c3_indicators = {
-            'card': ['card', 'ticket', 'story', 'task', 'issue'],
-            'conversation': ['discuss', 'talk', 'meeting', 'review', 'refinement'],
-            'confirmation': ['confirm', 'verify', 'accept', 'approve', 'sign-off']
-        }
-        
-        indicators = c3_indicators.get(element.lower(), [])
-        return any(indicator in content for indicator in indicators)
+    def _check_framework_element(self, element: str, hits: Dict[Tuple[str, str], set], ac_text_lower: str, framework_key: str) -> bool:
+        """Check if a framework element is present using pre-scanned indicator hits and the lowercased AC text"""
+        element_lower = element.lower()
+        if framework_key == 'accept' and element_lower == 'testable':
+            return 'verify' in ac_text_lower or 'check' in ac_text_lower
+        
+        return bool(hits.get((framework_key, element_lower)))
+
+    def _build_indicator_automaton(self):
+        """Build a single Aho-Corasick automaton over every framework indicator keyword"""
+        if ahocorasick is None:
+            return None
+        
+        owners = defaultdict(list)
+        for framework_key, elements in _FRAMEWORK_INDICATORS.items():
+            for element, keywords in elements.items():
+                for keyword in keywords:
+                    owners[keyword].append((framework_key, element))
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, keyword_owners in owners.items():
+            automaton.add_word(keyword, (keyword, tuple(keyword_owners)))
+        automaton.make_automaton()
+        return automaton
+
+    def _scan_indicators(self, content_lower: str) -> Dict[Tuple[str, str], set]:
+        """Scan lowercased content once and return {(framework, element): indicators found}"""
+        hits = defaultdict(set)
+        if self._indicator_automaton is not None:
+            for _, (keyword, keyword_owners) in self._indicator_automaton.iter(content_lower):
+                for owner in keyword_owners:
+                    hits[owner].add(keyword)
+            return hits
+        
+        for framework_key, elements in _FRAMEWORK_INDICATORS.items():
+            for element, keywords in elements.items():
+                found = {keyword for keyword in keywords if keyword in content_lower}
+                if found:
+                    hits[(framework_key, element)] = found
+        return hits
 
     def analyze_dor_requirements_enhanced(self, issue_data: Dict[str, Any]) -> Dict[str, Any]:
         """Enhanced DoR analysis with weighted scoring"""
@@ -825,12 +1537,19 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         total_weight = 0
         weighted_score = 0
         
+        # Bind the per-requirement targets once instead of re-walking dor_analysis each pass
+        detailed_analysis = dor_analysis['detailed_analysis']
+        present_append = dor_analysis['present_fields'].append
+        missing_append = dor_analysis['missing_fields'].append
+        check_requirement = self._check_dor_requirement
+        
         for req_key, req_info in self.dor_requirements.items():
-            is_present = self._check_dor_requirement(req_key, issue_data)
+            is_present = check_requirement(req_key, issue_data)
             weight = req_info['weight']
+            name = req_info['name']
             
-            dor_analysis['detailed_analysis'][req_key] = {
-                'name': req_info['name'],
+            detailed_analysis[req_key] = {
+                'name': name,
                 'description': req_info['description'],
                 'required': req_info['required'],
                 'weight': weight,
@@ -839,10 +1558,10 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
             }
             
             if is_present:
-                dor_analysis['present_fields'].append(req_info['name'])
+                present_append(name)
                 weighted_score += weight
             else:
-                dor_analysis['missing_fields'].append(req_info['name'])
+                missing_append(name)
             
             total_weight += weight
         
@@ -856,59 +1575,46 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
 
     def _check_dor_requirement(self, req_key: str, issue_data: Dict[str, Any]) -> bool:
         """Check if a specific DoR requirement is met"""
-        if req_key == 'user_story':
-            return self._check_user_story_requirement(issue_data)
-        elif req_key == 'acceptance_criteria':
-            return len(issue_data.get('acceptance_criteria', [])) > 0
-        elif req_key == 'testing_steps':
-            return len(issue_data.get('test_scenarios', [])) > 0
-        elif req_key == 'implementation_details':
-            return self._check_implementation_details(issue_data)
-        elif req_key == 'architectural_solution':
-            return self._check_architectural_solution(issue_data)
-        elif req_key == 'ada_criteria':
-            return self._check_ada_criteria(issue_data)
-        elif req_key == 'additional_fields':
-            return self._check_additional_fields(issue_data)
-        
-        return False
+        check = self._dor_checks.get(req_key)
+        return check(issue_data) if check else False
+
+    def _check_acceptance_criteria_requirement(self, issue_data: Dict[str, Any]) -> bool:
+        """Check if acceptance criteria are present"""
+        return len(issue_data.get('acceptance_criteria', [])) > 0
+
+    def _check_testing_steps_requirement(self, issue_data: Dict[str, Any]) -> bool:
+        """Check if testing steps are present"""
+        return len(issue_data.get('test_scenarios', [])) > 0
 
     def _check_user_story_requirement(self, issue_data: Dict[str, Any]) -> bool:
         """Check if user story requirement is met"""
-        description = issue_data.get('description', '').lower()
-        summary = issue_data.get('summary', '').lower()
+        description = _lower(issue_data.get('description', ''))
+        summary = _lower(issue_data.get('summary', ''))
         content = description + ' ' + summary
         
         # Check for user story format
-        story_patterns = [
-            r'as\s+(?:a\s+)?[^,]+,\s*i\s+want\s+[^,]+,\s*so\s+that\s+.+',
-            r'as\s+(?:a\s+)?[^,]+,\s*i\s+need\s+[^,]+,\s*so\s+that\s+.+'
-        ]
-        
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in story_patterns)
+        return _USER_STORY_FORMAT_RE.search(content) is not None
 
     def _check_implementation_details(self, issue_data: Dict[str, Any]) -> bool:
         """Check if implementation details are present"""
-        description = issue_data.get('description', '').lower()
+        description = _lower(issue_data.get('description', ''))
         comments = issue_data.get('comments', [])
         
         # Check for PR/deployment info
-        implementation_indicators = ['pr', 'pull request', 'deploy', 'deployment', 'implementation', 'technical']
-        
-        if any(indicator in description for indicator in implementation_indicators):
+        if 'implementation' in _dor_indicator_hits(description):
             return True
         
         # Check comments for implementation details
         for comment in comments:
             comment_text = comment.get('body', '').lower()
-            if any(indicator in comment_text for indicator in implementation_indicators):
+            if 'implementation' in _dor_indicator_hits(comment_text):
                 return True
         
         return False
 
     def _check_architectural_solution(self, issue_data: Dict[str, Any]) -> bool:
         """Check if architectural solution is present"""
-        description = issue_data.get('description', '').lower()
+        description = _lower(issue_data.get('description', ''))
         figma_links = issue_data.get('figma_links', [])
         
         # Check for design/architecture links
@@ -916,23 +1622,20 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
             return True
         
         # Check for architecture keywords
-        architecture_indicators = ['design', 'architecture', 'workflow', 'diagram', 'figma', 'mockup']
-        return any(indicator in description for indicator in architecture_indicators)
+        return 'architecture' in _dor_indicator_hits(description)
 
     def _check_ada_criteria(self, issue_data: Dict[str, Any]) -> bool:
         """Check if ADA criteria are present"""
-        description = issue_data.get('description', '').lower()
+        description = _lower(issue_data.get('description', ''))
         acceptance_criteria = issue_data.get('acceptance_criteria', [])
         
         # Check for accessibility keywords
-        ada_indicators = ['accessibility', 'ada', 'wcag', 'screen reader', 'keyboard', 'aria']
-        
-        if any(indicator in description for indicator in ada_indicators):
+        if 'ada' in _dor_indicator_hits(description):
             return True
         
         # Check acceptance criteria for accessibility
         for ac in acceptance_criteria:
-            if any(indicator in ac.lower() for indicator in ada_indicators):
+            if 'ada' in _dor_indicator_hits(ac.lower()):
                 return True
         
         return False
@@ -954,7 +1657,7 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         try:
             # Handle input - either Jira issue dict or content string
             if isinstance(jira_issue_or_content, str):
-                if re.match(r'^[A-Z]+-\d+$', jira_issue_or_content.strip()):
+                if _TICKET_KEY_RE.match(jira_issue_or_content.strip()):
                     # It's a ticket number, fetch from Jira
                     if not self.jira_integration:
                         return {"error": "Jira integration not available"}
@@ -964,23 +1667,7 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
                         return {"error": f"Could not fetch ticket {jira_issue_or_content}"}
                 else:
                     # It's content, create minimal issue data
-                    jira_issue = {
-                        'key': 'PASTED-CONTENT',
-                        'fields': {
-                            'summary': 'Pasted Content Analysis',
-                            'description': jira_issue_or_content,
-                            'issuetype': {'name': 'Unknown'},
-                            'status': {'name': 'Unknown'},
-                            'priority': {'name': 'None'},
-                            'assignee': None,
-                            'reporter': None,
-                            'created': '',
-                            'updated': '',
-                            'project': {'name': 'Unknown'},
-                            'labels': [],
-                            'components': []
-                        }
-                    }
+                    jira_issue = _pasted_content_issue(jira_issue_or_content)
             else:
                 jira_issue = jira_issue_or_content
             
@@ -990,28 +1677,24 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
             # Detect card type
             card_type_analysis = self.detect_card_type(issue_data)
             
-            # Analyze story structure
-            story_analysis = self.analyze_story(issue_data)
-            
-            # Audit acceptance criteria with enhanced rewrites
-            ac_audit = self.audit_acceptance_criteria_enhanced(issue_data.get('acceptance_criteria', []))
-            
-            # Generate comprehensive test scenarios (P/N/E)
-            test_scenarios = self.generate_comprehensive_test_scenarios(issue_data)
-            
-            # Audit bug (if applicable)
-            bug_audit = None
+            # The analyzers only read issue_data, so run them concurrently: the story rewrite
+            # waits on the LLM and stays on this thread, while enhanced AC rewrites, P/N/E test
+            # scenarios, framework scoring, weighted DoR and the bug audit (if applicable) are
+            # CPU-bound scans for the shared pool
+            calls = [
+                (self.analyze_story, issue_data),
+                (self.audit_acceptance_criteria_enhanced, issue_data.get('acceptance_criteria', [])),
+                (self.generate_comprehensive_test_scenarios, issue_data),
+                (self.analyze_frameworks_enhanced, issue_data),
+                (self.analyze_dor_requirements_enhanced, issue_data)
+            ]
             if card_type_analysis['detected_type'] == 'bug':
-                bug_audit = self.audit_bug(issue_data)
-            
-            # Analyze frameworks with enhanced scoring
-            framework_scores = self.analyze_frameworks_enhanced(issue_data)
-            
-            # Enhanced DoR analysis
-            dor_analysis = self.analyze_dor_requirements_enhanced(issue_data)
+                calls.append((self.audit_bug, issue_data))
+            story_analysis, ac_audit, test_scenarios, framework_scores, dor_analysis, *bug_audit = _run_analyzers(*calls)
+            bug_audit = bug_audit[0] if bug_audit else None
             
             # Calculate technical/ADA coverage
-            technical_ada = self._calculate_technical_ada_coverage(issue_data, test_scenarios)
+            technical_ada = self._calculate_technical_ada_coverage(issue_data, test_scenarios, dor_analysis)
             
             # Calculate sprint readiness with new formula: DoR(60%) + Frameworks(25%) + Technical/Test(15%)
             readiness_analysis = self.calculate_readiness_enhanced(dor_analysis, framework_scores, technical_ada)
@@ -1019,10 +1702,8 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
             # Generate role-tagged recommendations
             role_recommendations = self._generate_role_tagged_recommendations(dor_analysis, ac_audit, test_scenarios, bug_audit, framework_scores, technical_ada)
             
-            # DesignSync analysis (if Figma link provided)
-            designsync = None
-            if figma_link:
-                designsync = self._analyze_designsync(issue_data, figma_link, ac_audit, test_scenarios)
+            # DesignSync is not part of the markdown report, so it is only built by the
+            # structured-output paths that render it (see _create_structured_data)
             
             # Build enhanced structured output
                         # ⛳️ Build Enhanced Groom markdown (no numeric framework acronyms in visible text)
@@ -1096,20 +1777,9 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
             # Ticket meta
             key = issue_data.get('key', '')
             key_part = f" — {key}" if key else ""
-            mode_text = (mode or "actionable").title()
+            mode_text = _MODE_LABELS.get(mode or "actionable") or mode.title()
 
             # Build markdown
-            def _bullets(lines):
-                return "\n".join([f"- {x}" for x in lines if str(x).strip()])
-
-            def _numbered(lines):
-                out = []
-                for i, x in enumerate(lines, 1):
-                    x = str(x).strip()
-                    if x:
-                        out.append(f"{i}. {x}")
-                return "\n".join(out) if out else "1. (add acceptance criteria)"
-
             md_parts = []
             md_parts.append(f"# 📋 Enhanced Groom Analysis{key_part}")
             md_parts.append(f"**Title:** {title}")
@@ -1118,41 +1788,42 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
             # Ticket Summary (2–4 lines)
             summary_lines = []
             summary_lines.append(f"Mode: **{mode_text}**")
-            ct = self.detect_card_type(issue_data).get('detected_type', 'story').title()
+            detected_type = card_type_analysis.get('detected_type', 'story')
+            ct = _CARD_TYPE_LABELS.get(detected_type) or detected_type.title()
             summary_lines.append(f"Card Type: **{ct}**")
             if issue_data.get('components'):
                 summary_lines.append("Components: " + ", ".join(issue_data['components']))
             if issue_data.get('labels'):
                 summary_lines.append("Labels: " + ", ".join(issue_data['labels']))
-            md_parts.append("\n## 🔎 Ticket Summary\n" + _bullets(summary_lines))
+            md_parts.append("\n## 🔎 Ticket Summary\n" + _md_bullets(summary_lines))
 
             # Readiness Gaps
-            md_parts.append("\n## 🚥 Readiness Gaps (blockers to pull into sprint)\n" + _bullets(gaps_lines))
+            md_parts.append("\n## 🚥 Readiness Gaps (blockers to pull into sprint)\n" + _md_bullets(gaps_lines))
 
             # Suggested Story Rewrite
             md_parts.append("\n## ✍️ Suggested Story Rewrite (paste into Description)\n" + (story_rewrite or "_Add a user story in 'As a, I want, So that' format._"))
 
             # Acceptance Criteria (final, testable)
-            md_parts.append("\n## ✅ Acceptance Criteria (final, testable)\n" + _numbered(final_acs))
+            md_parts.append("\n## ✅ Acceptance Criteria (final, testable)\n" + _md_numbered(final_acs))
 
             # Test Scenarios
             scenario_blocks = []
-            if pos: scenario_blocks.append("**Happy path**\n" + _bullets(pos))
-            if neg: scenario_blocks.append("**Negative/validation**\n" + _bullets(neg))
-            if err: scenario_blocks.append("**Error/Resilience**\n" + _bullets(err))
+            if pos: scenario_blocks.append("**Happy path**\n" + _md_bullets(pos))
+            if neg: scenario_blocks.append("**Negative/validation**\n" + _md_bullets(neg))
+            if err: scenario_blocks.append("**Error/Resilience**\n" + _md_bullets(err))
             if not scenario_blocks:
                 scenario_blocks.append("_Add positive, negative, and error scenarios aligned to ACs._")
             md_parts.append("\n## 🧪 Test Scenarios (specific to this story)\n" + "\n\n".join(scenario_blocks))
 
             # Tech / Implementation Notes
-            md_parts.append("\n## 🧱 Tech / Implementation Notes\n" + _bullets(tech_notes))
+            md_parts.append("\n## 🧱 Tech / Implementation Notes\n" + _md_bullets(tech_notes))
 
             # Non-Goals (optional)
             non_goals = []
             if bug_audit and bug_audit.get('non_goals'):
                 non_goals = bug_audit['non_goals']
             if non_goals:
-                md_parts.append("\n## 📌 Non-Goals\n" + _bullets(non_goals))
+                md_parts.append("\n## 📌 Non-Goals\n" + _md_bullets(non_goals))
 
             # Next Actions
             if not next_actions:
@@ -1160,7 +1831,7 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
                                 "**Dev:** Outline technical approach and dependencies.",
                                 "**QA:** Draft edge/negative/ADA test cases aligned to AC.",
                                 "**Analytics:** Confirm tagging/flag validation."]
-            md_parts.append("\n## 🎯 Next Actions\n" + _bullets(next_actions))
+            md_parts.append("\n## 🎯 Next Actions\n" + _md_bullets(next_actions))
 
             md = "\n".join(md_parts).strip()
 
@@ -1218,27 +1889,17 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     
     def generate_comprehensive_test_scenarios(self, issue_data: Dict[str, Any]) -> Dict[str, List[str]]:
         """Generate comprehensive test scenarios (Positive/Negative/Error)"""
-        scenarios = {
-            "positive": [],
-            "negative": [],
-            "error": []
-        }
-        
         # Extract key functionality from issue data
         summary = issue_data.get('summary', '')
         description = issue_data.get('description', '')
         ac_list = issue_data.get('acceptance_criteria', [])
         
-        # Generate positive scenarios
-        scenarios["positive"] = self._generate_positive_scenarios(summary, description, ac_list)
-        
-        # Generate negative scenarios
-        scenarios["negative"] = self._generate_negative_scenarios(summary, description, ac_list)
-        
-        # Generate error scenarios
-        scenarios["error"] = self._generate_error_scenarios(summary, description, ac_list)
-        
-        return scenarios
+        # Each category is generated straight into the result rather than into an empty skeleton
+        return {
+            "positive": self._generate_positive_scenarios(summary, description, ac_list),
+            "negative": self._generate_negative_scenarios(summary, description, ac_list),
+            "error": self._generate_error_scenarios(summary, description, ac_list)
+        }
     
     def analyze_frameworks_enhanced(self, issue_data: Dict[str, Any]) -> Dict[str, int]:
         """Enhanced framework analysis with improved scoring"""
@@ -1258,44 +1919,44 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         
         return scores
     
-    def _calculate_technical_ada_coverage(self, issue_data: Dict[str, Any], test_scenarios: Dict[str, List[str]]) -> Dict[str, Any]:
-        """Calculate technical and ADA coverage with detailed breakdown"""
-        technical_ada = {
-            "ImplementationDetails": "Missing",
-            "ArchitecturalSolution": "Missing", 
-            "ADA": {
-                "Status": "Missing",
-                "Notes": []
-            },
-            "NFR": {
-                "Performance": "",
-                "Security": "",
-                "DevOps": ""
-            }
-        }
+    def _calculate_technical_ada_coverage(self, issue_data: Dict[str, Any], test_scenarios: Dict[str, List[str]],
+                                          dor_analysis: Optional[Dict] = None) -> Dict[str, Any]:
+        """Calculate technical and ADA coverage, reusing analyze_dor_requirements_enhanced results when provided"""
+        dor_details = (dor_analysis or {}).get('detailed_analysis', {})
+        
+        def _dor_present(req_key: str, check) -> bool:
+            if req_key in dor_details:
+                return dor_details[req_key]['present']
+            return check(issue_data)
         
         # Check implementation details
-        if self._check_implementation_details(issue_data):
-            technical_ada["ImplementationDetails"] = "OK"
+        implementation_status = "Missing"
+        if _dor_present('implementation_details', self._check_implementation_details):
+            implementation_status = "OK"
         elif self._has_partial_implementation_details(issue_data):
-            technical_ada["ImplementationDetails"] = "Partial"
+            implementation_status = "Partial"
         
         # Check architectural solution
-        if self._check_architectural_solution(issue_data):
-            technical_ada["ArchitecturalSolution"] = "OK"
+        architecture_status = "Missing"
+        if _dor_present('architectural_solution', self._check_architectural_solution):
+            architecture_status = "OK"
         elif self._has_partial_architectural_solution(issue_data):
-            technical_ada["ArchitecturalSolution"] = "Partial"
+            architecture_status = "Partial"
         
         # Check ADA criteria
         ada_status, ada_notes = self._check_ada_detailed(issue_data)
-        technical_ada["ADA"]["Status"] = ada_status
-        technical_ada["ADA"]["Notes"] = ada_notes
-        
-        # Check NFR (Non-Functional Requirements)
-        nfr = self._check_nfr_requirements(issue_data)
-        technical_ada["NFR"] = nfr
         
-        return technical_ada
+        # Build the result once rather than filling in a placeholder skeleton
+        return {
+            "ImplementationDetails": implementation_status,
+            "ArchitecturalSolution": architecture_status,
+            "ADA": {
+                "Status": ada_status,
+                "Notes": ada_notes
+            },
+            # Check NFR (Non-Functional Requirements)
+            "NFR": self._check_nfr_requirements(issue_data)
+        }
     
     def calculate_readiness_enhanced(self, dor_analysis: Dict, framework_scores: Dict, technical_ada: Dict) -> Dict[str, Any]:
         """Calculate sprint readiness with new formula: DoR(60%) + Frameworks(25%) + Technical/Test(15%)"""
@@ -1334,49 +1995,49 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     def _generate_role_tagged_recommendations(self, dor_analysis: Dict, ac_audit: Dict, test_scenarios: Dict, 
                                             bug_audit: Optional[Dict], framework_scores: Dict, technical_ada: Dict) -> Dict[str, List[str]]:
         """Generate role-tagged recommendations (PO, QA, Dev/Tech Lead)"""
-        recommendations = {
-            "PO": [],
-            "QA": [],
-            "Dev": []
-        }
+        # Each role collects into a local list; the result dict is built once at the end
+        po_recs = []
+        qa_recs = []
+        dev_recs = []
         
         # PO recommendations
         missing_fields = dor_analysis.get('missing_fields', [])
         if missing_fields:
-            recommendations["PO"].extend([f"Complete {field}" for field in missing_fields[:3]])
+            po_recs.extend([f"Complete {field}" for field in missing_fields[:3]])
         
         if ac_audit['weak'] > 0:
-            recommendations["PO"].append(f"Rewrite {ac_audit['weak']} weak acceptance criteria")
+            po_recs.append(f"Rewrite {ac_audit['weak']} weak acceptance criteria")
         
         if framework_scores.get('ROI', 0) < 20:
-            recommendations["PO"].append("Clarify business value and ROI")
+            po_recs.append("Clarify business value and ROI")
         
         # QA recommendations
-        total_scenarios = sum(len(scenarios) for scenarios in test_scenarios.values())
+        total_scenarios = sum(map(len, test_scenarios.values()))
         if total_scenarios < 6:
-            recommendations["QA"].append("Define comprehensive test scenarios (P/N/E)")
+            qa_recs.append("Define comprehensive test scenarios (P/N/E)")
         
         if not test_scenarios.get('error'):
-            recommendations["QA"].append("Add error handling test scenarios")
+            qa_recs.append("Add error handling test scenarios")
         
         if not test_scenarios.get('negative'):
-            recommendations["QA"].append("Add negative test scenarios for edge cases")
+            qa_recs.append("Add negative test scenarios for edge cases")
         
         # Dev recommendations
         if technical_ada["ImplementationDetails"] == "Missing":
-            recommendations["Dev"].append("Add implementation and deployment details")
+            dev_recs.append("Add implementation and deployment details")
         
         if technical_ada["ArchitecturalSolution"] == "Missing":
-            recommendations["Dev"].append("Define architectural solution and design")
+            dev_recs.append("Define architectural solution and design")
         
         if technical_ada["ADA"]["Status"] == "Missing":
-            recommendations["Dev"].append("Add ADA compliance requirements")
+            dev_recs.append("Add ADA compliance requirements")
         
         # Limit to 3 recommendations per role
-        for role in recommendations:
-            recommendations[role] = recommendations[role][:3]
-        
-        return recommendations
+        return {
+            "PO": po_recs[:3],
+            "QA": qa_recs[:3],
+            "Dev": dev_recs[:3]
+        }
     
     def _analyze_designsync(self, issue_data: Dict[str, Any], figma_link: str, ac_audit: Dict, test_scenarios: Dict) -> Dict[str, Any]:
         """Analyze DesignSync integration with Figma"""
@@ -1434,7 +2095,7 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         
         # Header
         readiness = output["Readiness"]
-        status_emoji = "✅" if readiness["Score"] >= 90 else "⚠️" if readiness["Score"] >= 70 else "❌"
+        status_emoji = _readiness_marker(readiness["Score"])
         status_label = readiness["Status"]
         
         lines.append(f"⚡ Actionable Groom Report — {output['TicketKey']} | {output['Title']}")
@@ -1491,9 +2152,9 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         # Technical/ADA
         technical = output["TechnicalADA"]
         lines.append("🧱 Technical / ADA / Architecture")
-        lines.append(f"• Implementation Details: {'✅' if technical['ImplementationDetails'] == 'OK' else '⚠️' if technical['ImplementationDetails'] == 'Partial' else '❌'} (PRs/URLs/flags)")
-        lines.append(f"• Architectural Solution: {'✅' if technical['ArchitecturalSolution'] == 'OK' else '⚠️' if technical['ArchitecturalSolution'] == 'Partial' else '❌'} (link/design note)")
-        lines.append(f"• ADA: {'✅' if technical['ADA']['Status'] == 'OK' else '⚠️' if technical['ADA']['Status'] == 'Partial' else '❌'} ({', '.join(technical['ADA']['Notes'][:3])})")
+        lines.append(f"• Implementation Details: {_TECH_STATUS_EMOJI.get(technical['ImplementationDetails'], _NOT_READY_MARKER)} (PRs/URLs/flags)")
+        lines.append(f"• Architectural Solution: {_TECH_STATUS_EMOJI.get(technical['ArchitecturalSolution'], _NOT_READY_MARKER)} (link/design note)")
+        lines.append(f"• ADA: {_TECH_STATUS_EMOJI.get(technical['ADA']['Status'], _NOT_READY_MARKER)} ({', '.join(technical['ADA']['Notes'][:3])})")
         
         # NFR if applicable
         nfr_items = [f"{k}: {v}" for k, v in technical['NFR'].items() if v]
@@ -1528,7 +2189,7 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         
         # Header
         readiness = output["Readiness"]
-        status_emoji = "✅" if readiness["Score"] >= 90 else "⚠️" if readiness["Score"] >= 70 else "❌"
+        status_emoji = _readiness_marker(readiness["Score"])
         
         lines.append(f"🔍 Insight Analysis — {output['TicketKey']}")
         lines.append(f"Readiness: {readiness['Score']}% ({status_emoji} {readiness['Status']})")
@@ -1567,35 +2228,19 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     
     def _generate_summary_markdown(self, output: Dict[str, Any]) -> str:
         """Generate compact summary markdown (120-180 words target)"""
-        lines = []
-        
-        # Header
         readiness = output["Readiness"]
-        status_emoji = "✅" if readiness["Score"] >= 90 else "⚠️" if readiness["Score"] >= 70 else "❌"
-        
-        lines.append(f"📊 Summary — {output['TicketKey']}")
-        lines.append(f"Readiness: {readiness['Score']}% → {status_emoji} {readiness['Status']}")
-        lines.append("")
-        
-        # Top 3 gaps
-        lines.append("Top 3 gaps:")
-        for gap in readiness['WeakAreas'][:3]:
-            lines.append(f"• {gap}")
-        lines.append("")
-        
-        # Next 3 actions
         recommendations = output["Recommendations"]
-        all_recs = recommendations["PO"] + recommendations["QA"] + recommendations["Dev"]
-        lines.append("Next 3 actions:")
-        for action in all_recs[:3]:
-            lines.append(f"• {action}")
-        lines.append("")
-        
-        # Framework scores as single line
-        frameworks = output["FrameworkScores"]
-        lines.append(f"Framework scores: ROI {frameworks['ROI']} | INVEST {frameworks['INVEST']} | ACCEPT {frameworks['ACCEPT']} | 3C {frameworks['3C']}")
-        
-        return "\n".join(lines)
+        next_actions = islice(chain(recommendations["PO"], recommendations["QA"], recommendations["Dev"]), 3)
+        
+        return _SUMMARY_MARKDOWN_TEMPLATE.format(
+            ticket_key=output['TicketKey'],
+            score=readiness['Score'],
+            status_emoji=_readiness_marker(readiness["Score"]),
+            status=readiness['Status'],
+            gaps="".join(f"• {gap}\n" for gap in readiness['WeakAreas'][:3]),
+            actions="".join(f"• {action}\n" for action in next_actions),
+            frameworks=output["FrameworkScores"]
+        )
     
     def generate_enhanced_output(self, output: Dict[str, Any]) -> str:
         """Generate both markdown and JSON output for enhanced GroomRoom"""
@@ -1632,11 +2277,16 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
             "NotReady": 0
         }
         
-        # Analyze each ticket
-        for ticket in tickets:
+        def _analyze(ticket):
             figma_link = figma_links.get(ticket.get('key', ''), None) if figma_links else None
-            result = self.analyze_ticket(ticket, mode, figma_link)
-            
+            return _as_batch_worker(self.analyze_ticket, ticket, mode, figma_link)
+        
+        # Tickets are independent and mostly wait on Jira/Azure OpenAI, so analyze them
+        # concurrently; map() keeps the results in input order
+        with ThreadPoolExecutor(max_workers=_BATCH_CONCURRENCY, thread_name_prefix='groomroom-batch') as executor:
+            analyses = list(executor.map(_analyze, tickets))
+        
+        for result in analyses:
             if "error" not in result:
                 results.append(result)
                 batch_summary["TotalAnalysed"] += 1
@@ -1689,14 +2339,7 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         """Apply length guardrails and quality gates"""
         word_count = output.get("word_count", 0)
         
-        # Define target ranges
-        target_ranges = {
-            "actionable": (300, 600),
-            "insight": (180, 350),
-            "summary": (120, 180)
-        }
-        
-        min_words, max_words = target_ranges.get(mode, (300, 600))
+        min_words, max_words = _LENGTH_TARGET_RANGES.get(mode, (300, 600))
         
         # Check if content needs enrichment or compression
         if word_count < min_words:
@@ -1799,14 +2442,11 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
 
     def _is_weak_ac(self, ac: str) -> bool:
         """Check if acceptance criteria is weak or vague"""
-        weak_indicators = [
-            "should", "could", "might", "maybe", "possibly",
-            "as needed", "if required", "when appropriate",
-            "user friendly", "intuitive", "easy to use"
-        ]
-        
-        ac_lower = ac.lower()
-        return any(indicator in ac_lower for indicator in weak_indicators) or len(ac.strip()) < 20
+        # A too-short AC is weak regardless of wording, so skip the indicator scan
+        if len(ac.strip()) < 20:
+            return True
+        ac_lower = _lower(ac)
+        return any(map(ac_lower.__contains__, _WEAK_AC_INDICATORS))
     
     def _rewrite_weak_ac(self, ac: str) -> str:
         """Rewrite weak acceptance criteria to be testable and measurable"""
@@ -1817,15 +2457,17 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     def _generate_positive_scenarios(self, summary: str, description: str, ac_list: List[str]) -> List[str]:
         """Generate positive test scenarios"""
         scenarios = []
+        summary_lower = _lower(summary)
+        description_lower = _lower(description)
         
         # Extract key actions from summary and description
-        if "login" in summary.lower() or "authentication" in description.lower():
+        if "login" in summary_lower or "authentication" in description_lower:
             scenarios.append("User successfully logs in with valid credentials")
         
-        if "payment" in summary.lower() or "checkout" in description.lower():
+        if "payment" in summary_lower or "checkout" in description_lower:
             scenarios.append("User completes payment with valid payment method")
         
-        if "search" in summary.lower():
+        if "search" in summary_lower:
             scenarios.append("User finds relevant results with valid search query")
         
         # Add generic positive scenario if none specific
@@ -1837,14 +2479,15 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     def _generate_negative_scenarios(self, summary: str, description: str, ac_list: List[str]) -> List[str]:
         """Generate negative test scenarios"""
         scenarios = []
+        summary_lower = _lower(summary)
         
-        if "login" in summary.lower():
+        if "login" in summary_lower:
             scenarios.append("User cannot login with invalid credentials")
         
-        if "payment" in summary.lower():
+        if "payment" in summary_lower:
             scenarios.append("Payment fails with invalid payment details")
         
-        if "search" in summary.lower():
+        if "search" in summary_lower:
             scenarios.append("No results returned for invalid search query")
         
         # Add generic negative scenario
@@ -1856,12 +2499,14 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     def _generate_error_scenarios(self, summary: str, description: str, ac_list: List[str]) -> List[str]:
         """Generate error handling test scenarios"""
         scenarios = []
+        summary_lower = _lower(summary)
+        description_lower = _lower(description)
         
-        if "api" in description.lower() or "service" in description.lower():
+        if "api" in description_lower or "service" in description_lower:
             scenarios.append("System handles API timeout gracefully")
             scenarios.append("System recovers from network errors")
         
-        if "payment" in summary.lower():
+        if "payment" in summary_lower:
             scenarios.append("Payment service unavailable - show retry option")
         
         # Add generic error scenarios
@@ -1967,30 +2612,28 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     
     def _has_partial_implementation_details(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue has partial implementation details"""
-        description = issue_data.get('description', '').lower()
-        return any(keyword in description for keyword in ['implementation', 'technical', 'code', 'api'])
+        description = _lower(issue_data.get('description', ''))
+        return _PARTIAL_IMPLEMENTATION_RE.search(description) is not None
     
     def _has_partial_architectural_solution(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue has partial architectural solution"""
-        description = issue_data.get('description', '').lower()
-        return any(keyword in description for keyword in ['architecture', 'design', 'system', 'component'])
+        description = _lower(issue_data.get('description', ''))
+        return _PARTIAL_ARCHITECTURE_RE.search(description) is not None
     
     def _check_ada_detailed(self, issue_data: Dict[str, Any]) -> Tuple[str, List[str]]:
         """Check ADA compliance with detailed notes"""
-        description = issue_data.get('description', '').lower()
+        description = _lower(issue_data.get('description', ''))
         ac_list = issue_data.get('acceptance_criteria', [])
         
         ada_notes = []
         status = "Missing"
         
         # Check for accessibility keywords
-        accessibility_keywords = ['accessibility', 'ada', 'wcag', 'screen reader', 'keyboard', 'focus', 'alt text', 'contrast']
-        
-        if any(keyword in description for keyword in accessibility_keywords):
+        if _ACCESSIBILITY_RE.search(description):
             status = "Partial"
             ada_notes.append("Accessibility mentioned in description")
         
-        if any(keyword in ' '.join(ac_list).lower() for keyword in accessibility_keywords):
+        if _ACCESSIBILITY_RE.search(_lower(' '.join(ac_list))):
             status = "OK"
             ada_notes.append("Accessibility covered in acceptance criteria")
         
@@ -2001,7 +2644,7 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     
     def _check_nfr_requirements(self, issue_data: Dict[str, Any]) -> Dict[str, str]:
         """Check non-functional requirements"""
-        description = issue_data.get('description', '').lower()
+        description = _lower(issue_data.get('description', ''))
         
         nfr = {
             "Performance": "",
@@ -2010,15 +2653,15 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         }
         
         # Performance
-        if any(keyword in description for keyword in ['performance', 'speed', 'response time', 'load']):
+        if _NFR_PERFORMANCE_RE.search(description):
             nfr["Performance"] = "Performance requirements mentioned"
         
         # Security
-        if any(keyword in description for keyword in ['security', 'authentication', 'authorization', 'encryption']):
+        if _NFR_SECURITY_RE.search(description):
             nfr["Security"] = "Security considerations mentioned"
         
         # DevOps
-        if any(keyword in description for keyword in ['deployment', 'infrastructure', 'monitoring', 'logging']):
+        if _NFR_DEVOPS_RE.search(description):
             nfr["DevOps"] = "DevOps considerations mentioned"
         
         return nfr
@@ -2028,25 +2671,28 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         score = 0
         
         # Implementation details (30%)
-        if technical_ada["ImplementationDetails"] == "OK":
+        implementation = technical_ada["ImplementationDetails"]
+        if implementation == "OK":
             score += 30
-        elif technical_ada["ImplementationDetails"] == "Partial":
+        elif implementation == "Partial":
             score += 15
         
         # Architectural solution (30%)
-        if technical_ada["ArchitecturalSolution"] == "OK":
+        architecture = technical_ada["ArchitecturalSolution"]
+        if architecture == "OK":
             score += 30
-        elif technical_ada["ArchitecturalSolution"] == "Partial":
+        elif architecture == "Partial":
             score += 15
         
         # ADA compliance (20%)
-        if technical_ada["ADA"]["Status"] == "OK":
+        ada_status = technical_ada["ADA"]["Status"]
+        if ada_status == "OK":
             score += 20
-        elif technical_ada["ADA"]["Status"] == "Partial":
+        elif ada_status == "Partial":
             score += 10
         
         # NFR coverage (20%)
-        nfr_count = sum(1 for nfr in technical_ada["NFR"].values() if nfr)
+        nfr_count = sum(map(bool, technical_ada["NFR"].values()))
         score += (nfr_count / 3) * 20
         
         return score
@@ -2054,27 +2700,27 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     # Helper methods for framework scoring
     def _has_business_value(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue has clear business value"""
-        description = issue_data.get('description', '').lower()
-        return any(keyword in description for keyword in ['business value', 'roi', 'revenue', 'customer', 'user benefit'])
+        description = _lower(issue_data.get('description', ''))
+        return any(map(description.__contains__, ('business value', 'roi', 'revenue', 'customer', 'user benefit')))
     
     def _has_clear_objectives(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue has clear objectives"""
-        summary = issue_data.get('summary', '').lower()
+        summary = _lower(issue_data.get('summary', ''))
         return 'as a' in summary and 'i want' in summary
     
     def _has_implementation_plan(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue has implementation plan"""
-        description = issue_data.get('description', '').lower()
-        return any(keyword in description for keyword in ['implementation', 'technical', 'development', 'code'])
+        description = _lower(issue_data.get('description', ''))
+        return any(map(description.__contains__, ('implementation', 'technical', 'development', 'code')))
     
     def _is_independent(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue is independent"""
-        description = issue_data.get('description', '').lower()
+        description = _lower(issue_data.get('description', ''))
         return 'dependency' not in description and 'blocked' not in description
     
     def _is_negotiable(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue is negotiable"""
-        summary = issue_data.get('summary', '').lower()
+        summary = _lower(issue_data.get('summary', ''))
         return 'must' not in summary and 'required' not in summary
     
     def _is_valuable(self, issue_data: Dict[str, Any]) -> bool:
@@ -2083,7 +2729,7 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     
     def _is_estimable(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue is estimable"""
-        description = issue_data.get('description', '').lower()
+        description = _lower(issue_data.get('description', ''))
         return len(description) > 50 and 'unknown' not in description
     
     def _is_small(self, issue_data: Dict[str, Any]) -> bool:
@@ -2098,7 +2744,7 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     
     def _is_actionable(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue is actionable"""
-        summary = issue_data.get('summary', '').lower()
+        summary = _lower(issue_data.get('summary', ''))
         return 'as a' in summary and 'i want' in summary
     
     def _is_clear(self, issue_data: Dict[str, Any]) -> bool:
@@ -2114,20 +2760,19 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     
     def _is_edge_case_aware(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue is edge case aware"""
-        description = issue_data.get('description', '').lower()
+        description = _lower(issue_data.get('description', ''))
         ac_list = issue_data.get('acceptance_criteria', [])
-        edge_keywords = ['error', 'invalid', 'empty', 'null', 'exception', 'timeout']
-        return any(keyword in description or any(keyword in ac.lower() for ac in ac_list) for keyword in edge_keywords)
+        return _EDGE_CASE_RE.search(description) is not None or _EDGE_CASE_RE.search(_lower(' '.join(ac_list))) is not None
     
     def _is_precise(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue is precise"""
         summary = issue_data.get('summary', '')
-        return len(summary.split()) > 3 and 'vague' not in summary.lower()
+        return len(summary.split()) > 3 and 'vague' not in _lower(summary)
     
     def _has_good_card(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue has good card format"""
         summary = issue_data.get('summary', '')
-        return len(summary) > 10 and 'as a' in summary.lower()
+        return len(summary) > 10 and 'as a' in _lower(summary)
     
     def _has_conversation_notes(self, issue_data: Dict[str, Any]) -> bool:
         """Check if issue has conversation notes"""
@@ -2257,8 +2902,15 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     def _format_actionable_output(self, output: Dict[str, Any]) -> Dict[str, Any]:
         """Format output for Actionable (QA + DoR Coaching) mode - Structured sections"""
         readiness = output.get("SprintReadiness", 0)
-        status_emoji = "✅" if readiness >= 90 else "⚠️" if readiness >= 70 else "❌"
+        status_emoji = _readiness_marker(readiness)
         status_text = "Ready for Dev" if readiness >= 90 else "Needs Refinement" if readiness >= 70 else "Not Ready"
+        # One lowercased buffer answers every scenario keyword check with a C-level find
+        scenarios_lower = "\n".join(output.get("SuggestedTestScenarios", [])).lower()
+        # Tag each recommendation with its roles in a single automaton pass
+        tagged_recommendations = [
+            (rec, _scan_groups(_RECOMMENDATION_ROLE_AUTOMATON, _RECOMMENDATION_ROLE_GROUPS, rec.lower()))
+            for rec in output.get("Recommendations", [])
+        ]
         
         return {
             "mode": "actionable",
@@ -2272,8 +2924,8 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
                     "persona_goal_found": output.get("StoryAnalysis", {}).get("has_clear_structure", False),
                     "benefit_clarity": "Clear" if output.get("StoryAnalysis", {}).get("story_quality_score", 0) >= 70 else "Unclear",
                     "suggested_rewrite": output.get("StoryRewrite"),
-                    "missing_business_metric": not any("roi" in str(item).lower() or "business" in str(item).lower() 
-                                                     for item in output.get("Recommendations", []))
+                    "missing_business_metric": not any("roi" in item_lower or "business" in item_lower
+                                                     for item_lower in (str(item).lower() for item in output.get("Recommendations", [])))
                 },
                 "acceptance_criteria": {
                     "title": "✅ Acceptance Criteria",
@@ -2284,8 +2936,8 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
                 "qa_scenarios": {
                     "title": "🧪 QA Scenarios",
                     "suggested_scenarios": output.get("SuggestedTestScenarios", []),
-                    "missing_negative_flow": len([s for s in output.get("SuggestedTestScenarios", []) if "negative" in s.lower()]) == 0,
-                    "missing_error_handling": len([s for s in output.get("SuggestedTestScenarios", []) if "error" in s.lower()]) == 0
+                    "missing_negative_flow": "negative" not in scenarios_lower,
+                    "missing_error_handling": "error" not in scenarios_lower
                 },
                 "technical_ada": {
                     "title": "🧱 Technical / ADA",
@@ -2295,16 +2947,16 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
                 }
             },
             "recommendations": {
-                "po": [rec for rec in output.get("Recommendations", []) if any(word in rec.lower() for word in ["story", "acceptance", "criteria", "business"])],
-                "qa": [rec for rec in output.get("Recommendations", []) if any(word in rec.lower() for word in ["test", "scenario", "qa", "testing"])],
-                "dev": [rec for rec in output.get("Recommendations", []) if any(word in rec.lower() for word in ["implementation", "technical", "architecture", "deployment"])]
+                "po": [rec for rec, roles in tagged_recommendations if 'po' in roles],
+                "qa": [rec for rec, roles in tagged_recommendations if 'qa' in roles],
+                "dev": [rec for rec, roles in tagged_recommendations if 'dev' in roles]
             }
         }
 
     def _format_summary_output(self, output: Dict[str, Any]) -> Dict[str, Any]:
         """Format output for Summary (Snapshot) mode - Compact card format"""
         readiness = output.get("SprintReadiness", 0)
-        status_emoji = "✅" if readiness >= 90 else "⚠️" if readiness >= 70 else "❌"
+        status_emoji = _readiness_marker(readiness)
         status_text = "Ready for Dev" if readiness >= 90 else "Needs Refinement" if readiness >= 70 else "Not Ready"
         
         # Get top 3 gaps
@@ -2336,10 +2988,11 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         test_scenarios = output.get("SuggestedTestScenarios", [])
         qa_notes = []
         
-        # Check for different test types
-        has_positive = any("positive" in scenario.lower() for scenario in test_scenarios)
-        has_negative = any("negative" in scenario.lower() for scenario in test_scenarios)
-        has_error = any("error" in scenario.lower() for scenario in test_scenarios)
+        # Check for different test types against one lowercased buffer (keywords never span the newline joins)
+        scenarios_lower = "\n".join(test_scenarios).lower()
+        has_positive = "positive" in scenarios_lower
+        has_negative = "negative" in scenarios_lower
+        has_error = "error" in scenarios_lower
         
         if not has_positive:
             qa_notes.append("Add positive test scenario for main user flow")
@@ -2353,20 +3006,23 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
     def summarize_output(self, analysis_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate summary for batch analysis"""
         total_analyzed = len(analysis_results)
-        ready_count = sum(1 for result in analysis_results if result.get("SprintReadiness", 0) >= 90)
-        needs_refinement_count = sum(1 for result in analysis_results if 70 <= result.get("SprintReadiness", 0) < 90)
-        not_ready_count = total_analyzed - ready_count - needs_refinement_count
         
-        # Common issues
-        all_missing_fields = []
+        # One pass tallies readiness buckets, the readiness total and missing-field counts
+        ready_count = 0
+        needs_refinement_count = 0
+        readiness_total = 0
+        common_issues = Counter()
         for result in analysis_results:
-            all_missing_fields.extend(result.get("DefinitionOfReady", {}).get("MissingFields", []))
-        
-        common_issues = {}
-        for field in all_missing_fields:
-            common_issues[field] = common_issues.get(field, 0) + 1
+            readiness = result.get("SprintReadiness", 0)
+            readiness_total += readiness
+            if readiness >= 90:
+                ready_count += 1
+            elif readiness >= 70:
+                needs_refinement_count += 1
+            common_issues.update(result.get("DefinitionOfReady", {}).get("MissingFields", []))
+        not_ready_count = total_analyzed - ready_count - needs_refinement_count
         
-        top_issues = sorted(common_issues.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_issues = common_issues.most_common(5)
         
         return {
             "Summary": f"{total_analyzed} analyzed – {ready_count} Ready, {needs_refinement_count} Need Refinement, {not_ready_count} Not Ready",
@@ -2374,11 +3030,14 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
             "NeedsRefinementCount": needs_refinement_count,
             "NotReadyCount": not_ready_count,
             "TopIssues": [{"field": field, "count": count} for field, count in top_issues],
-            "AverageReadiness": sum(result.get("SprintReadiness", 0) for result in analysis_results) / total_analyzed if total_analyzed > 0 else 0
+            "AverageReadiness": readiness_total / total_analyzed if total_analyzed > 0 else 0
         }
 
     def extract_jira_fields(self, jira_issue: Dict) -> Dict[str, Any]:
         """Extract all relevant fields from Jira issue dynamically"""
+        # Each extraction gets its own ADF memo on this thread, so concurrent batch
+        # threads sharing this instance never see or clear each other's entries
+        _adf_memo.texts = {}
         try:
             fields = jira_issue.get('fields', {})
             
@@ -2413,6 +3072,9 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         except Exception as e:
             console.print(f"[red]Error extracting Jira fields: {e}[/red]")
             return {}
+        finally:
+            # Entries hold references to the issue payload, so drop them once extraction is done
+            _adf_memo.texts = None
 
     def _extract_description(self, description_field) -> str:
         """Safely extract description from various formats"""
@@ -2421,83 +3083,66 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         elif isinstance(description_field, dict):
             # Handle Atlassian Document Format
             if 'content' in description_field:
-                content_parts = []
-                for content_item in description_field.get('content', []):
-                    if content_item.get('type') == 'paragraph':
-                        for text_item in content_item.get('content', []):
-                            if text_item.get('type') == 'text':
-                                content_parts.append(text_item.get('text', ''))
-                return ' '.join(content_parts) if content_parts else ''
+                # The same ADF body is flattened by several extractors per issue; the memo
+                # only lives for one extract_jira_fields call and holds each body it keys on,
+                # so an id() cannot be reused by another object while its entry exists
+                memo = getattr(_adf_memo, 'texts', None)
+                if memo is None:
+                    return self._flatten_adf(description_field)
+                cached = memo.get(id(description_field))
+                if cached is not None and cached[0] is description_field:
+                    return cached[1]
+                text = self._flatten_adf(description_field)
+                memo[id(description_field)] = (description_field, text)
+                return text
             else:
                 return str(description_field)
         else:
             return str(description_field)
 
+    def _flatten_adf(self, description_field: Dict) -> str:
+        """Join the paragraph text nodes of an Atlassian Document Format body"""
+        content_parts = []
+        for content_item in description_field.get('content', []):
+            if content_item.get('type') == 'paragraph':
+                for text_item in content_item.get('content', []):
+                    if text_item.get('type') == 'text':
+                        content_parts.append(text_item.get('text', ''))
+        return ' '.join(content_parts) if content_parts else ''
+
+    def _collect_field_texts(self, fields: Dict, field_name: str, key_matches) -> List[str]:
+        """Read a mapped text field, falling back to custom fields whose lowercased key matches"""
+        texts = _field_texts(self._get_field_value(fields, field_name))
+        if not texts:
+            for key, value in fields.items():
+                if key_matches(key.lower()):
+                    texts.extend(_field_texts(value))
+        return texts
+
     def _extract_acceptance_criteria(self, fields: Dict) -> List[str]:
         """Extract acceptance criteria from various possible fields"""
-        ac_list = []
-        
-        # Try dynamic field mapping first
-        ac_value = self._get_field_value(fields, 'Acceptance Criteria')
-        if ac_value:
-            if isinstance(ac_value, str) and ac_value.strip():
-                ac_list.append(ac_value.strip())
-            elif isinstance(ac_value, list):
-                ac_list.extend([str(item).strip() for item in ac_value if str(item).strip()])
-        
-        # Fallback: Check custom fields for AC
-        if not ac_list:
-            for key, value in fields.items():
-                if 'acceptance' in key.lower() or 'criteria' in key.lower():
-                    if isinstance(value, str) and value.strip():
-                        ac_list.append(value.strip())
-                    elif isinstance(value, list):
-                        ac_list.extend([str(item).strip() for item in value if str(item).strip()])
+        # Dynamic field mapping first, then custom fields named like AC
+        ac_list = self._collect_field_texts(fields, 'Acceptance Criteria',
+                                            lambda key: 'acceptance' in key or 'criteria' in key)
         
         # Check description for AC patterns
         description = self._extract_description(fields.get('description'))
         if description:
-            # Look for AC patterns in description
-            ac_patterns = [
-                r'Acceptance Criteria[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)',
-                r'AC[:\s]*(.*?)(?=\n\n|\n[A-Z]|$)',
-                r'Given.*?When.*?Then.*?(?=\n\n|\n[A-Z]|$)',
-            ]
-            
-            for pattern in ac_patterns:
-                matches = re.findall(pattern, description, re.DOTALL | re.IGNORECASE)
-                for match in matches:
-                    if match.strip():
-                        ac_list.append(match.strip())
+            # Look for AC patterns in description (parsed once per distinct description)
+            ac_list.extend(_description_ac_sections(description))
         
         return list(set(ac_list))  # Remove duplicates
 
     def _extract_test_scenarios(self, fields: Dict) -> List[str]:
         """Extract test scenarios from various possible fields"""
-        test_list = []
-        
-        # Try dynamic field mapping first
-        test_value = self._get_field_value(fields, 'Test Scenarios')
-        if test_value:
-            if isinstance(test_value, str) and test_value.strip():
-                test_list.append(test_value.strip())
-            elif isinstance(test_value, list):
-                test_list.extend([str(item).strip() for item in test_value if str(item).strip()])
-        
-        # Fallback: Check custom fields for test scenarios
-        if not test_list:
-            for key, value in fields.items():
-                if 'test' in key.lower() and 'scenario' in key.lower():
-                    if isinstance(value, str) and value.strip():
-                        test_list.append(value.strip())
-                    elif isinstance(value, list):
-                        test_list.extend([str(item).strip() for item in value if str(item).strip()])
+        # Dynamic field mapping first, then custom fields named like test scenarios
+        test_list = self._collect_field_texts(fields, 'Test Scenarios',
+                                              lambda key: 'test' in key and 'scenario' in key)
         
         return list(set(test_list))
 
     def _extract_figma_links(self, fields: Dict) -> List[str]:
         """Extract Figma links from description and comments"""
-        figma_links = []
         text_content = []
         
         # Add description
@@ -2511,13 +3156,14 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
             if comment.get('body'):
                 text_content.append(self._extract_description(comment.get('body')))
         
-        # Find Figma links
-        figma_pattern = r'https?://[^\s]*figma[^\s]*'
-        for text in text_content:
-            matches = re.findall(figma_pattern, text, re.IGNORECASE)
-            figma_links.extend(matches)
+        # Find Figma links in one scan; URLs never span whitespace, so joining on newlines
+        # cannot merge or split a match, and text that never mentions Figma skips the regex
+        combined_text = '\n'.join(text_content)
+        if 'figma' not in combined_text.lower():
+            return []
         
-        return list(set(figma_links))
+        # Dedup while matching, keeping links in the order they appear in the ticket
+        return list(dict.fromkeys(_FIGMA_URL_RE.findall(combined_text)))
 
     def _extract_attachments(self, fields: Dict) -> List[Dict]:
         """Extract attachment information"""
@@ -2612,10 +3258,8 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
                 text_content.append(self._extract_description(comment.get('body')))
         
         # Find Figma links
-        figma_pattern = r'https?://[^\s]*figma[^\s]*'
         for text in text_content:
-            matches = re.findall(figma_pattern, text, re.IGNORECASE)
-            figma_links.extend(matches)
+            figma_links.extend(_FIGMA_URL_RE.findall(text))
         
         return list(set(figma_links))
 
@@ -2721,32 +3365,29 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
         present_count = 0
         
         for req_key, req_info in self.dor_requirements.items():
+            # Work out presence and details first so each record is built once, not filled in afterwards
             is_present = False
-            analysis = {
-                'name': req_info['name'],
-                'required': req_info.get('required', False),
-                'present': False,
-                'details': '',
-                'score': 0
-            }
+            details = ''
             
             if req_key == 'summary':
-                is_present = bool(issue_data.get('summary', '').strip())
-                analysis['details'] = issue_data.get('summary', '')[:100] + '...' if len(issue_data.get('summary', '')) > 100 else issue_data.get('summary', '')
+                summary = issue_data.get('summary', '')
+                is_present = bool(summary.strip())
+                details = summary[:100] + '...' if len(summary) > 100 else summary
                 
             elif req_key == 'description':
-                is_present = bool(issue_data.get('description', '').strip())
-                analysis['details'] = f"Length: {len(issue_data.get('description', ''))} characters"
+                description = issue_data.get('description', '')
+                is_present = bool(description.strip())
+                details = f"Length: {len(description)} characters"
                 
             elif req_key == 'acceptance_criteria':
                 ac_list = issue_data.get('acceptance_criteria', [])
                 is_present = len(ac_list) > 0
-                analysis['details'] = f"Found {len(ac_list)} acceptance criteria"
+                details = f"Found {len(ac_list)} acceptance criteria"
                 
             elif req_key == 'testing_steps':
                 test_list = issue_data.get('test_scenarios', [])
                 is_present = len(test_list) > 0
-                analysis['details'] = f"Found {len(test_list)} test scenarios"
+                details = f"Found {len(test_list)} test scenarios"
                 
             elif req_key == 'additional_fields':
                 additional_present = []
@@ -2758,10 +3399,7 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
                 if issue_data.get('dependencies'): additional_present.append('Dependencies')
                 
                 is_present = len(additional_present) >= 3  # At least 3 of 6 fields
-                analysis['details'] = f"Present: {', '.join(additional_present)}"
-            
-            analysis['present'] = is_present
-            analysis['score'] = 1 if is_present else 0
+                details = f"Present: {', '.join(additional_present)}"
             
             if is_present:
                 present_count += 1
@@ -2769,7 +3407,13 @@ Format each as: "Type: Description" (e.g., "Positive: Verify user can login with
             else:
                 dor_analysis['missing_elements'].append(req_info['name'])
             
-            dor_analysis['detailed_analysis'][req_key] = analysis
+            dor_analysis['detailed_analysis'][req_key] = {
+                'name': req_info['name'],
+                'required': req_info.get('required', False),
+                'present': is_present,
+                'details': details,
+                'score': 1 if is_present else 0
+            }
         
         dor_analysis['coverage_percentage'] = (present_count / total_requirements) * 100
         
@@ -2820,7 +3464,7 @@ Acceptance Criteria: "{ac}"
 Provide a concise critique (2-3 sentences max):"""
 
             response = self.client.chat.completions.create(
-                model=os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME'),
+                model=self._deployment_name,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
                 max_tokens=150
@@ -2848,7 +3492,7 @@ Original: "{ac}"
 Provide a single, improved acceptance criteria:"""
 
             response = self.client.chat.completions.create(
-                model=os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME'),
+                model=self._deployment_name,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
                 max_tokens=200
@@ -2871,17 +3515,12 @@ Provide a single, improved acceptance criteria:"""
         existing_tests = issue_data.get('test_scenarios', [])
         description = issue_data.get('description', '')
         
-        # Check for test scenario patterns in description
-        test_patterns = {
-            'positive': r'(positive|happy path|success|normal)',
-            'negative': r'(negative|error|edge case|failure)',
-            'rbt': r'(risk|boundary|edge|exception)'
-        }
-        
+        # Check for test scenario patterns in description (single scan, stops once all are found)
         found_types = set()
-        for test_type, pattern in test_patterns.items():
-            if re.search(pattern, description, re.IGNORECASE):
-                found_types.add(test_type)
+        for match in _TEST_CATEGORY_RE.finditer(description):
+            found_types.update(_TEST_CATEGORY_GROUPS[match.lastgroup])
+            if len(found_types) == 3:  # positive, negative and rbt all present
+                break
         
         # Add existing test scenarios
         for test in existing_tests:
@@ -2892,8 +3531,7 @@ Provide a single, improved acceptance criteria:"""
             })
         
         # Identify missing scenarios
-        required_scenarios = ['positive', 'negative', 'rbt']
-        missing_scenarios = [scenario for scenario in required_scenarios if scenario not in found_types]
+        missing_scenarios = [scenario for scenario in _REQUIRED_TEST_SCENARIOS if scenario not in found_types]
         
         for missing in missing_scenarios:
             test_analysis['missing_scenarios'].append({
@@ -2903,7 +3541,7 @@ Provide a single, improved acceptance criteria:"""
             })
         
         # Calculate coverage
-        total_required = len(required_scenarios)
+        total_required = len(_REQUIRED_TEST_SCENARIOS)
         present_count = len(found_types) + len(existing_tests)
         test_analysis['coverage_percentage'] = min((present_count / total_required) * 100, 100)
         
@@ -2914,29 +3552,19 @@ Provide a single, improved acceptance criteria:"""
 
     def _get_test_recommendation(self, test_type: str, issue_data: Dict) -> str:
         """Get specific test recommendation based on type"""
-        recommendations = {
-            'positive': f"Define positive test scenario for: {issue_data.get('summary', 'this feature')}",
-            'negative': f"Define negative test scenarios including error handling and edge cases",
-            'rbt': f"Define risk-based test scenarios focusing on high-impact failure points"
-        }
-        return recommendations.get(test_type, "Define appropriate test scenario")
+        if test_type not in _REQUIRED_TEST_SCENARIOS:
+            return "Define appropriate test scenario"
+        return _REQUIRED_TEST_SCENARIOS[test_type][0].format(summary=issue_data.get('summary', 'this feature'))
 
     def _generate_test_recommendations(self, issue_data: Dict, missing_scenarios: List[str]) -> List[str]:
         """Generate comprehensive test recommendations"""
-        recommendations = []
-        
-        if 'positive' in missing_scenarios:
-            recommendations.append("Add positive test scenario covering the main user journey")
-        
-        if 'negative' in missing_scenarios:
-            recommendations.append("Add negative test scenarios for error handling and edge cases")
-        
-        if 'rbt' in missing_scenarios:
-            recommendations.append("Add risk-based test scenarios for high-impact failure points")
+        recommendations = [plan for scenario, (_, plan) in _REQUIRED_TEST_SCENARIOS.items()
+                           if scenario in missing_scenarios]
         
         # Check for cross-browser/device testing
-        if not any('cross' in str(item).lower() or 'browser' in str(item).lower() 
-                  for item in issue_data.get('test_scenarios', []) + [issue_data.get('description', '')]):
+        test_texts = issue_data.get('test_scenarios', []) + [issue_data.get('description', '')]
+        test_text_lower = '\n'.join(map(str, test_texts)).lower()
+        if 'cross' not in test_text_lower and 'browser' not in test_text_lower:
             recommendations.append("Consider cross-browser/device testing requirements")
         
         return recommendations
@@ -2987,7 +3615,8 @@ Provide a single, improved acceptance criteria:"""
         if not ac_analysis:
             gaps.append("No acceptance criteria found")
         else:
-            poor_ac_count = sum(1 for ac in ac_analysis if 'vague' in ac.get('critique', '').lower() or 'unclear' in ac.get('critique', '').lower())
+            critiques = (ac.get('critique', '').lower() for ac in ac_analysis)
+            poor_ac_count = sum('vague' in critique or 'unclear' in critique for critique in critiques)
             if poor_ac_count > 0:
                 gaps.append(f"{poor_ac_count} acceptance criteria need improvement")
         
@@ -3002,10 +3631,14 @@ Provide a single, improved acceptance criteria:"""
         return gaps
 
     def build_structured_output(self, issue_data: Dict, dor_analysis: Dict, ac_analysis: List[Dict], 
-                              test_analysis: Dict, sprint_readiness: Dict, gaps: List[str]) -> Dict[str, Any]:
-        """Build structured JSON output for UI rendering"""
-        
-        return {
+                              test_analysis: Dict, sprint_readiness: Dict, gaps: List[str],
+                              include_alignment: bool = True) -> Dict[str, Any]:
+        """Build structured JSON output for UI rendering.
+
+        include_alignment=False leaves out the framework and brand sections, which
+        neither the analysis prompt nor the markdown fallback render.
+        """
+        structured_output = {
             'ticket_summary': {
                 'key': issue_data.get('key', ''),
                 'summary': issue_data.get('summary', ''),
@@ -3025,10 +3658,14 @@ Provide a single, improved acceptance criteria:"""
             'test_analysis': test_analysis,
             'sprint_readiness': sprint_readiness,
             'gaps_identified': gaps,
-            'next_actions': self._generate_next_actions(dor_analysis, ac_analysis, test_analysis, gaps),
-            'framework_alignment': self._analyze_framework_alignment(issue_data),
-            'brand_analysis': self._analyze_brand_abbreviations(issue_data)
+            'next_actions': self._generate_next_actions(dor_analysis, ac_analysis, test_analysis, gaps)
         }
+        
+        if include_alignment:
+            structured_output['framework_alignment'] = self._analyze_framework_alignment(issue_data)
+            structured_output['brand_analysis'] = self._analyze_brand_abbreviations(issue_data)
+        
+        return structured_output
 
     def _generate_next_actions(self, dor_analysis: Dict, ac_analysis: List[Dict], 
                               test_analysis: Dict, gaps: List[str]) -> List[str]:
@@ -3063,18 +3700,16 @@ Provide a single, improved acceptance criteria:"""
         
         framework_scores = {}
         for framework_key, framework_info in self.frameworks.items():
-            elements = framework_info['elements']
-            found_elements = []
-            
-            for element in elements:
-                if re.search(element.lower(), content, re.IGNORECASE):
-                    found_elements.append(element)
+            # One search per element; found/missing are split from the same hit list
+            hits = [(element, pattern.search(content) is not None)
+                    for element, pattern in self._framework_element_patterns[framework_key]]
+            found_elements = [element for element, hit in hits if hit]
             
             framework_scores[framework_key] = {
                 'name': framework_info['name'],
-                'coverage_percentage': (len(found_elements) / len(elements)) * 100,
+                'coverage_percentage': (len(found_elements) / len(hits)) * 100,
                 'found_elements': found_elements,
-                'missing_elements': [elem for elem in elements if elem not in found_elements]
+                'missing_elements': [element for element, hit in hits if not hit]
             }
         
         return framework_scores
@@ -3082,34 +3717,42 @@ Provide a single, improved acceptance criteria:"""
     def _analyze_brand_abbreviations(self, issue_data: Dict) -> Dict[str, Any]:
         """Analyze brand abbreviations usage"""
         content = f"{issue_data.get('summary', '')} {issue_data.get('description', '')}"
-        
-        found_brands = []
-        for brand, description in self.brand_abbreviations.items():
-            if re.search(r'\b' + brand + r'\b', content, re.IGNORECASE):
-                found_brands.append({
-                    'brand': brand,
-                    'description': description,
-                    'context': 'Found in ticket content'
-                })
+        tokens = _word_tokens(content)
+        
+        # One C-level intersection decides which brands are present; most tickets name none
+        present = self._brand_token_set & tokens
+        found_brands = [
+            {
+                'brand': brand,
+                'description': description,
+                'context': 'Found in ticket content'
+            }
+            for brand_token, brand, description in self._brand_tokens
+            if brand_token in present
+        ] if present else []
         
         return {
             'found_brands': found_brands,
             'total_brands_found': len(found_brands),
-            'recommendations': self._generate_brand_recommendations(found_brands, content)
+            'recommendations': self._generate_brand_recommendations(found_brands, content, tokens)
         }
 
-    def _generate_brand_recommendations(self, found_brands: List[Dict], content: str) -> List[str]:
+    def _generate_brand_recommendations(self, found_brands: List[Dict], content: str, tokens: frozenset = None) -> List[str]:
         """Generate brand-specific recommendations"""
         recommendations = []
+        if tokens is None:
+            tokens = _word_tokens(content)
+        
+        brands = {brand['brand'] for brand in found_brands}
         
         # Check for PWA (ELF) flows
-        if any(brand['brand'] == 'ELF' for brand in found_brands):
-            if not re.search(r'\b(PLP|PDP|Homepage|Minicart)\b', content, re.IGNORECASE):
+        if 'ELF' in brands:
+            if not tokens & _ELF_PAGE_TOKENS:
                 recommendations.append("PWA (ELF) flows should specify applicable pages (PLP, PDP, Homepage, Minicart)")
         
         # Check for EMEA payment
-        if any(brand['brand'] == 'EMEA' for brand in found_brands):
-            if re.search(r'\b(AfterPay|Klarna)\b', content, re.IGNORECASE):
+        if 'EMEA' in brands:
+            if tokens & _BNPL_TOKENS:
                 recommendations.append("EMEA brands should use ClearPay instead of AfterPay/Klarna")
         
         return recommendations
@@ -3122,51 +3765,138 @@ Provide a single, improved acceptance criteria:"""
         
         return estimated_tokens < max_tokens, estimated_tokens
 
+    def _groom_cache_key(self, ticket_content: str, level: str) -> Tuple[str, str]:
+        """Build a content-derived cache key for groom analysis results"""
+        # Client presence separates LLM-written analyses from the formatted fallback
+        digest = hashlib.blake2b(f"{self.client is not None}\0{ticket_content}".encode('utf-8'), digest_size=16).hexdigest()
+        return digest, level
+
+    def _cache_groom_analysis(self, key: Tuple[str, str], analysis: str) -> str:
+        """Store a groom analysis result, evicting the least recently used entry"""
+        _cache_put(_GROOM_CACHE, _GROOM_CACHE_LOCK, key, analysis, _GROOM_CACHE_SIZE)
+        return analysis
+
+    def _run_analysis_pipeline(self, issue_data: Dict, include_alignment: bool = True) -> Dict[str, Any]:
+        """Run the independent analyzers concurrently and build the structured output"""
+        # AC critique/rewrite is LLM-bound, so overlap it with the DoR and test scans
+        ac_analysis, dor_analysis, test_analysis = _run_analyzers(
+            (self.analyze_acceptance_criteria, issue_data.get('acceptance_criteria', [])),
+            (self.analyze_dor_requirements, issue_data),
+            (self.analyze_test_scenarios, issue_data)
+        )
+        sprint_readiness = self.evaluate_sprint_readiness(dor_analysis)
+        gaps = self.identify_gaps(dor_analysis, ac_analysis, test_analysis)
+        
+        return self.build_structured_output(
+            issue_data, dor_analysis, ac_analysis, test_analysis, sprint_readiness, gaps,
+            include_alignment=include_alignment
+        )
+
+    def _prepare_groom_analysis(self, ticket_content: str, level: str) -> Tuple[Optional[str], Optional[Dict], Optional[Tuple[str, str]]]:
+        """Resolve ticket content and run the analyzers.
+
+        Returns (finished_analysis, None, None) when no LLM call is needed, otherwise
+        (None, structured_output, cache_key) for the final analysis step.
+        """
+        # If ticket_content is a Jira ticket number, fetch the full ticket
+        is_ticket_key = bool(_TICKET_KEY_RE.match(ticket_content.strip()))
+        
+        # Drafts too short to groom skip the analyzers and the LLM round-trip
+        if not is_ticket_key and len(ticket_content.strip()) < _MIN_TICKET_CONTENT_CHARS:
+            return _INSUFFICIENT_CONTENT_ANALYSIS, None, None
+        
+        # Pasted content fully determines the result, so repeat submissions reuse it
+        cache_key = None
+        if not is_ticket_key:
+            cache_key = self._groom_cache_key(ticket_content, level)
+            cached = _cache_get(_GROOM_CACHE, _GROOM_CACHE_LOCK, cache_key)
+            if cached is not None:
+                return cached, None, None
+        
+        if is_ticket_key:
+            if not self.jira_integration:
+                return "Jira integration not available", None, None
+            
+            ticket_info = self.jira_integration.get_ticket_info(ticket_content.strip())
+            if not ticket_info:
+                return f"Could not fetch ticket {ticket_content}", None, None
+            
+            issue_data = self.extract_jira_fields(ticket_info)
+        else:
+            # For pasted content, create minimal issue data
+            issue_data = {
+                'key': 'PASTED-CONTENT',
+                'summary': 'Pasted Content Analysis',
+                'description': ticket_content,
+                'issue_type': 'Unknown',
+                'acceptance_criteria': [],
+                'test_scenarios': [],
+                'figma_links': [],
+                'attachments': [],
+                'linked_issues': [],
+                'comments': [],
+                'agile_team': '',
+                'dependencies': []
+            }
+        
+        # Run the analysis pipeline; the markdown analysis never renders framework/brand sections
+        return None, self._run_analysis_pipeline(issue_data, include_alignment=False), cache_key
+
     def generate_groom_analysis(self, ticket_content: str, level: str = "default") -> str:
         """Main pipeline for generating comprehensive groom analysis"""
         try:
-            # If ticket_content is a Jira ticket number, fetch the full ticket
-            if re.match(r'^[A-Z]+-\d+$', ticket_content.strip()):
-                if not self.jira_integration:
-                    return "Jira integration not available"
-                
-                ticket_info = self.jira_integration.get_ticket_info(ticket_content.strip())
-                if not ticket_info:
-                    return f"Could not fetch ticket {ticket_content}"
-                
-                issue_data = self.extract_jira_fields(ticket_info)
-            else:
-                # For pasted content, create minimal issue data
-                issue_data = {
-                    'key': 'PASTED-CONTENT',
-                    'summary': 'Pasted Content Analysis',
-                    'description': ticket_content,
-                    'issue_type': 'Unknown',
-                    'acceptance_criteria': [],
-                    'test_scenarios': [],
-                    'figma_links': [],
-                    'attachments': [],
-                    'linked_issues': [],
-                    'comments': [],
-                    'agile_team': '',
-                    'dependencies': []
-                }
-            
-            # Run the complete analysis pipeline
-            dor_analysis = self.analyze_dor_requirements(issue_data)
-            ac_analysis = self.analyze_acceptance_criteria(issue_data.get('acceptance_criteria', []))
-            test_analysis = self.analyze_test_scenarios(issue_data)
-            sprint_readiness = self.evaluate_sprint_readiness(dor_analysis)
-            gaps = self.identify_gaps(dor_analysis, ac_analysis, test_analysis)
-            
-            # Build structured output
-            structured_output = self.build_structured_output(
-                issue_data, dor_analysis, ac_analysis, test_analysis, sprint_readiness, gaps
-            )
+            finished, structured_output, cache_key = self._prepare_groom_analysis(ticket_content, level)
+            if structured_output is None:
+                return finished
             
             # Generate final analysis using LLM
             final_analysis = self._generate_final_analysis(structured_output, level)
             
+            if cache_key is not None:
+                return self._cache_groom_analysis(cache_key, final_analysis)
+            return final_analysis
+            
+        except Exception as e:
+            console.print(f"[red]Error in groom analysis pipeline: {e}[/red]")
+            return self.get_fallback_groom_analysis()
+
+    def generate_groom_analysis_batch(self, tickets: List[str], level: str = "default") -> List[str]:
+        """Groom several tickets, overlapping their Azure OpenAI round-trips.
+
+        Results are returned in input order. Inside a running event loop asyncio.run would
+        raise, so there the tickets are groomed sequentially; async callers can await
+        _agenerate_groom_analysis_batch directly instead.
+        """
+        if not self.async_client or _event_loop_running():
+            return [self.generate_groom_analysis(ticket_content, level) for ticket_content in tickets]
+        
+        return asyncio.run(self._agenerate_groom_analysis_batch(tickets, level))
+
+    async def _agenerate_groom_analysis_batch(self, tickets: List[str], level: str) -> List[str]:
+        """Run the async groom pipeline for every ticket, at most _BATCH_CONCURRENCY at a time"""
+        # Keep large batches inside the Azure OpenAI deployment's rate limits
+        semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+        
+        async def _groom_one(ticket_content: str) -> str:
+            async with semaphore:
+                return await self._agenerate_groom_analysis(ticket_content, level)
+        
+        return list(await asyncio.gather(*(_groom_one(ticket_content) for ticket_content in tickets)))
+
+    async def _agenerate_groom_analysis(self, ticket_content: str, level: str) -> str:
+        """Async counterpart of generate_groom_analysis"""
+        try:
+            # Analyzers and Jira fetches are blocking, so keep them off the event loop
+            finished, structured_output, cache_key = await asyncio.to_thread(
+                _as_batch_worker, self._prepare_groom_analysis, ticket_content, level
+            )
+            if structured_output is None:
+                return finished
+            
+            final_analysis = await self._agenerate_final_analysis(structured_output, level)
+            
+            if cache_key is not None:
+                return self._cache_groom_analysis(cache_key, final_analysis)
             return final_analysis
             
         except Exception as e:
@@ -3189,7 +3919,7 @@ Provide a single, improved acceptance criteria:"""
             # Handle both Jira issue objects and ticket content strings
             if isinstance(jira_issue_or_content, str):
                 # If it's a ticket number, fetch from Jira
-                if re.match(r'^[A-Z]+-\d+$', jira_issue_or_content.strip()):
+                if _TICKET_KEY_RE.match(jira_issue_or_content.strip()):
                     if not self.jira_integration:
                         return {"error": "Jira integration not available"}
                     
@@ -3198,23 +3928,7 @@ Provide a single, improved acceptance criteria:"""
                         return {"error": f"Could not fetch ticket {jira_issue_or_content}"}
                 else:
                     # Create minimal issue data from pasted content
-                    jira_issue = {
-                        'key': 'PASTED-CONTENT',
-                        'fields': {
-                            'summary': 'Pasted Content Analysis',
-                            'description': jira_issue_or_content,
-                            'issuetype': {'name': 'Unknown'},
-                            'status': {'name': 'Unknown'},
-                            'priority': {'name': 'None'},
-                            'assignee': None,
-                            'reporter': None,
-                            'created': '',
-                            'updated': '',
-                            'project': {'name': 'Unknown'},
-                            'labels': [],
-                            'components': []
-                        }
-                    }
+                    jira_issue = _pasted_content_issue(jira_issue_or_content)
             else:
                 jira_issue = jira_issue_or_content
             
@@ -3226,16 +3940,7 @@ Provide a single, improved acceptance criteria:"""
                 console.print(f"[blue]Field mapper available: {self.field_mapper is not None}[/blue]")
             
             # Run the complete analysis pipeline
-            dor_analysis = self.analyze_dor_requirements(issue_data)
-            ac_analysis = self.analyze_acceptance_criteria(issue_data.get('acceptance_criteria', []))
-            test_analysis = self.analyze_test_scenarios(issue_data)
-            sprint_readiness = self.evaluate_sprint_readiness(dor_analysis)
-            gaps = self.identify_gaps(dor_analysis, ac_analysis, test_analysis)
-            
-            # Build structured output
-            structured_output = self.build_structured_output(
-                issue_data, dor_analysis, ac_analysis, test_analysis, sprint_readiness, gaps
-            )
+            structured_output = self._run_analysis_pipeline(issue_data)
             
             # Generate final analysis using LLM if available
             if self.client:
@@ -3281,65 +3986,24 @@ Provide a single, improved acceptance criteria:"""
 
     def get_groom_level_prompt(self, level: str) -> str:
         """Get the prompt template for a specific groom level"""
-        level_prompts = {
-            'updated': """Provide an updated analysis focusing on:
-1. Current sprint readiness
-2. Recent changes and updates
-3. Priority actions for immediate implementation
-4. Team collaboration points""",
-            
-            'strict': """Provide a strict analysis focusing on:
-1. Definition of Ready compliance
-2. Missing critical elements
-3. Quality standards adherence
-4. Risk assessment and mitigation""",
-            
-            'light': """Provide a light analysis focusing on:
-1. Key gaps and missing elements
-2. Top 3 priority actions
-3. Sprint readiness assessment
-4. Quick wins and improvements""",
-            
-            'default': """Provide a comprehensive analysis including:
-1. Detailed DOR assessment
-2. Acceptance criteria improvements
-3. Test scenario recommendations
-4. Framework alignment
-5. Brand-specific considerations
-6. Sprint readiness with specific next steps""",
-            
-            'insight': """Provide an insightful analysis focusing on:
-1. Business value and impact
-2. User experience considerations
-3. Technical complexity assessment
-4. Cross-team dependencies
-5. Strategic alignment""",
-            
-            'deep_dive': """Provide a deep dive analysis including:
-1. Comprehensive DOR analysis
-2. Detailed acceptance criteria review
-3. Extensive test scenario planning
-4. Framework alignment assessment
-5. Brand and component analysis
-6. Risk and dependency mapping
-7. Sprint planning recommendations""",
-            
-            'actionable': """Provide an actionable analysis focusing on:
-1. Specific next steps with owners
-2. Timeline and priority recommendations
-3. Resource requirements
-4. Success criteria and metrics
-5. Implementation roadmap""",
-            
-            'summary': """Provide a summary analysis including:
-1. Executive summary of readiness
-2. Key metrics and scores
-3. Critical gaps and blockers
-4. Recommended actions
-5. Timeline estimates"""
-        }
+        return _GROOM_LEVEL_PROMPTS.get(level, _GROOM_LEVEL_PROMPTS['default'])
+
+    def _build_final_analysis_prompt(self, structured_output: Dict, level: str) -> str:
+        """Create the final analysis prompt, dropping to light mode when it is too long"""
+        # Only the instructions depend on the level, so a light-mode retry reuses the rendered sections
+        prompt_fields = self._analysis_prompt_fields(structured_output)
+        prompt = self._create_analysis_prompt(structured_output, level, prompt_fields)
+        
+        # Check prompt length and handle accordingly
+        within_limits, token_count = self._check_prompt_length(prompt)
         
-        return level_prompts.get(level, level_prompts['default'])
+        # Word-limited levels are already as short as light mode, and light mode's longer reply
+        # would not fit their token cap
+        if not within_limits and level not in _LEVEL_ANALYSIS_INSTRUCTIONS:
+            console.print(f"[yellow]Prompt too long ({token_count} tokens), switching to light mode[/yellow]")
+            prompt = self._create_analysis_prompt(structured_output, "light", prompt_fields)
+        
+        return prompt
 
     def _generate_final_analysis(self, structured_output: Dict, level: str) -> str:
         """Generate final analysis using LLM with structured data"""
@@ -3347,22 +4011,34 @@ Provide a single, improved acceptance criteria:"""
             return self._format_structured_output(structured_output)
         
         try:
-            # Create comprehensive prompt
-            prompt = self._create_analysis_prompt(structured_output, level)
+            prompt = self._build_final_analysis_prompt(structured_output, level)
             
-            # Check prompt length and handle accordingly
-            within_limits, token_count = self._check_prompt_length(prompt)
+            response = self.client.chat.completions.create(
+                model=self._deployment_name,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.3,
+                max_tokens=_FINAL_ANALYSIS_MAX_TOKENS.get(level, 2000)
+            )
             
-            if not within_limits:
-                console.print(f"[yellow]Prompt too long ({token_count} tokens), switching to light mode[/yellow]")
-                level = "light"
-                prompt = self._create_analysis_prompt(structured_output, level)
+            return response.choices[0].message.content.strip()
             
-            response = self.client.chat.completions.create(
-                model=os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME'),
+        except Exception as e:
+            console.print(f"[red]Error generating final analysis: {e}[/red]")
+            return self._format_structured_output(structured_output)
+
+    async def _agenerate_final_analysis(self, structured_output: Dict, level: str) -> str:
+        """Async counterpart of _generate_final_analysis using the async Azure OpenAI client"""
+        if not self.async_client:
+            return self._format_structured_output(structured_output)
+        
+        try:
+            prompt = self._build_final_analysis_prompt(structured_output, level)
+            
+            response = await self.async_client.chat.completions.create(
+                model=self._deployment_name,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
-                max_tokens=2000
+                max_tokens=_FINAL_ANALYSIS_MAX_TOKENS.get(level, 2000)
             )
             
             return response.choices[0].message.content.strip()
@@ -3371,132 +4047,113 @@ Provide a single, improved acceptance criteria:"""
             console.print(f"[red]Error generating final analysis: {e}[/red]")
             return self._format_structured_output(structured_output)
 
-    def _create_analysis_prompt(self, structured_output: Dict, level: str) -> str:
+    def _create_analysis_prompt(self, structured_output: Dict, level: str, prompt_fields: Dict[str, Any] = None) -> str:
         """Create analysis prompt based on level and structured data"""
+        if prompt_fields is None:
+            prompt_fields = self._analysis_prompt_fields(structured_output)
+        
+        overrides = {}
+        if level in _COMPACT_PROMPT_LEVELS and structured_output['acceptance_criteria_review']:
+            # Snapshot levels only report gaps, so the per-AC critique/rewrite text is left out
+            overrides['ac_review'] = _COMPACT_AC_REVIEW.format(
+                count=len(structured_output['acceptance_criteria_review'])
+            )
         
-        base_prompt = f"""You are a professional Jira ticket analyst. Analyze this ticket and provide a comprehensive groom analysis.
-
-TICKET SUMMARY:
-- Key: {structured_output['ticket_summary']['key']}
-- Summary: {structured_output['ticket_summary']['summary']}
-- Type: {structured_output['ticket_summary']['issue_type']}
-- Status: {structured_output['ticket_summary']['status']}
-- Assignee: {structured_output['ticket_summary']['assignee']}
-- Story Points: {structured_output['ticket_summary']['story_points']}
-- Agile Team: {structured_output['ticket_summary']['agile_team']}
-
-DEFINITION OF READY ANALYSIS:
-- Coverage: {structured_output['definition_of_ready']['coverage_percentage']:.1f}%
-- Present: {', '.join(structured_output['definition_of_ready']['present_elements'])}
-- Missing: {', '.join(structured_output['definition_of_ready']['missing_elements'])}
-
-SPRINT READINESS:
-- Score: {structured_output['sprint_readiness']['score']:.1f}/100
-- Status: {structured_output['sprint_readiness']['status']}
+        return _ANALYSIS_PROMPT_TEMPLATE.substitute(
+            prompt_fields,
+            instructions=_LEVEL_ANALYSIS_INSTRUCTIONS.get(level, _FULL_ANALYSIS_INSTRUCTIONS),
+            **overrides
+        )
 
-ACCEPTANCE CRITERIA REVIEW:
-"""
-        
-        # Add AC analysis
-        for i, ac in enumerate(structured_output['acceptance_criteria_review'], 1):
-            base_prompt += f"""
-{i}. Original: {ac['original']}
-   Critique: {ac['critique']}
-   Revised: {ac['revised']}
-"""
+    def _analysis_prompt_fields(self, structured_output: Dict) -> Dict[str, Any]:
+        """Render the level-independent prompt sections from the structured output"""
+        ticket = structured_output['ticket_summary']
+        dor = structured_output['definition_of_ready']
+        readiness = structured_output['sprint_readiness']
+        test_analysis = structured_output['test_analysis']
         
-        base_prompt += f"""
-TEST ANALYSIS:
-- Coverage: {structured_output['test_analysis']['coverage_percentage']:.1f}%
-- Missing Scenarios: {len(structured_output['test_analysis']['missing_scenarios'])}
-
-GAPS IDENTIFIED:
-{chr(10).join(f"- {gap}" for gap in structured_output['gaps_identified'])}
-
-NEXT ACTIONS:
-{chr(10).join(f"- {action}" for action in structured_output['next_actions'])}
-
+        ac_review = ''.join(
+            f"""
+{i}. Original: {original}
+   Critique: {critique}
+   Revised: {revised}
 """
+            for i, (original, critique, revised) in enumerate(map(_AC_REVIEW_FIELDS, structured_output['acceptance_criteria_review']), 1)
+        )
         
-        # Add level-specific instructions
-        if level == "light":
-            base_prompt += """Provide a concise analysis focusing on:
-1. Key gaps and missing elements
-2. Top 3 priority actions
-3. Sprint readiness assessment
-Keep response under 500 words."""
-        else:
-            base_prompt += """Provide a comprehensive analysis including:
-1. Detailed DOR assessment
-2. Acceptance criteria improvements
-3. Test scenario recommendations
-4. Framework alignment
-5. Brand-specific considerations
-6. Sprint readiness with specific next steps
-Use markdown formatting with clear headings."""
-        
-        return base_prompt
+        return dict(
+            key=ticket['key'],
+            summary=ticket['summary'],
+            issue_type=ticket['issue_type'],
+            status=ticket['status'],
+            assignee=ticket['assignee'],
+            story_points=ticket['story_points'],
+            agile_team=ticket['agile_team'],
+            dor_coverage=f"{dor['coverage_percentage']:.1f}",
+            dor_present=', '.join(dor['present_elements']),
+            dor_missing=', '.join(dor['missing_elements']),
+            readiness_score=f"{readiness['score']:.1f}",
+            readiness_status=readiness['status'],
+            ac_review=ac_review,
+            test_coverage=f"{test_analysis['coverage_percentage']:.1f}",
+            missing_scenarios=len(test_analysis['missing_scenarios']),
+            gaps='\n'.join(f"- {gap}" for gap in structured_output['gaps_identified']),
+            next_actions='\n'.join(f"- {action}" for action in structured_output['next_actions'])
+        )
 
     def _format_structured_output(self, structured_output: Dict) -> str:
         """Format structured output as markdown when LLM is not available"""
-        output = []
+        # Every line is written newline-terminated; the final newline is dropped on return
+        buf = io.StringIO()
+        w = buf.write
         
         # Header
-        output.append("# Groom Room Analysis")
-        output.append("")
+        w("# Groom Room Analysis\n\n")
         
         # Ticket Summary
         ticket = structured_output['ticket_summary']
-        output.append(f"**Ticket:** {ticket['key']} - {ticket['summary']}")
-        output.append(f"**Type:** {ticket['issue_type']} | **Status:** {ticket['status']}")
-        output.append(f"**Assignee:** {ticket['assignee']} | **Team:** {ticket['agile_team']}")
-        output.append("")
+        w(f"**Ticket:** {ticket['key']} - {ticket['summary']}\n")
+        w(f"**Type:** {ticket['issue_type']} | **Status:** {ticket['status']}\n")
+        w(f"**Assignee:** {ticket['assignee']} | **Team:** {ticket['agile_team']}\n\n")
         
         # Sprint Readiness
         readiness = structured_output['sprint_readiness']
-        output.append(f"## Sprint Readiness: {readiness['status']} ({readiness['score']:.1f}/100)")
-        output.append("")
+        w(f"## Sprint Readiness: {readiness['status']} ({readiness['score']:.1f}/100)\n\n")
         
         # DOR Analysis
         dor = structured_output['definition_of_ready']
-        output.append(f"## Definition of Ready: {dor['coverage_percentage']:.1f}% Complete")
-        output.append("")
-        output.append("**Present Elements:**")
+        w(f"## Definition of Ready: {dor['coverage_percentage']:.1f}% Complete\n\n")
+        w("**Present Elements:**\n")
         for element in dor['present_elements']:
-            output.append(f"- ✅ {element}")
-        output.append("")
-        output.append("**Missing Elements:**")
+            w(f"- ✅ {element}\n")
+        w("\n**Missing Elements:**\n")
         for element in dor['missing_elements']:
-            output.append(f"- ❌ {element}")
-        output.append("")
+            w(f"- ❌ {element}\n")
+        w("\n")
         
         # Acceptance Criteria
         if structured_output['acceptance_criteria_review']:
-            output.append("## Acceptance Criteria Review")
-            output.append("")
-            for i, ac in enumerate(structured_output['acceptance_criteria_review'], 1):
-                output.append(f"### {i}. {ac['original'][:100]}...")
-                output.append(f"**Critique:** {ac['critique']}")
-                output.append(f"**Revised:** {ac['revised']}")
-                output.append("")
+            w("## Acceptance Criteria Review\n\n")
+            for i, (original, critique, revised) in enumerate(map(_AC_REVIEW_FIELDS, structured_output['acceptance_criteria_review']), 1):
+                w(f"### {i}. {original[:100]}...\n")
+                w(f"**Critique:** {critique}\n")
+                w(f"**Revised:** {revised}\n\n")
         
         # Test Analysis
         test = structured_output['test_analysis']
-        output.append(f"## Test Analysis: {test['coverage_percentage']:.1f}% Complete")
-        output.append("")
+        w(f"## Test Analysis: {test['coverage_percentage']:.1f}% Complete\n\n")
         if test['missing_scenarios']:
-            output.append("**Missing Test Scenarios:**")
-            for scenario in test['missing_scenarios']:
-                output.append(f"- {scenario['type']}: {scenario['description']}")
-            output.append("")
+            w("**Missing Test Scenarios:**\n")
+            for scenario_type, description in map(_SCENARIO_FIELDS, test['missing_scenarios']):
+                w(f"- {scenario_type}: {description}\n")
+            w("\n")
         
         # Next Actions
-        output.append("## Next Actions")
-        output.append("")
+        w("## Next Actions\n\n")
         for action in structured_output['next_actions']:
-            output.append(f"- {action}")
+            w(f"- {action}\n")
         
-        return "\n".join(output)
+        return buf.getvalue()[:-1]
 
     def _generate_fallback_analysis(self, ticket_content: str) -> str:
         """Generate a basic fallback analysis without external services"""
@@ -3530,31 +4187,14 @@ Please configure Azure OpenAI for enhanced analysis."""
 
     def get_fallback_groom_analysis(self) -> str:
         """Fallback analysis when services are unavailable"""
-        return """# Groom Room Analysis - Service Unavailable
-
-**Status:** Analysis services are currently unavailable.
-
-**Please check:**
-- Azure OpenAI configuration
-- Jira integration status
-- Network connectivity
-
-**Manual Review Checklist:**
-- [ ] Clear summary and description
-- [ ] Acceptance criteria defined
-- [ ] Test scenarios identified
-- [ ] Story points estimated
-- [ ] Team assigned
-- [ ] Dependencies identified
-
-Please try again or contact support if the issue persists."""
+        return _FALLBACK_GROOM_ANALYSIS
 
     def generate_enhanced_response(self, jira_issue_or_content: Union[Dict, str], mode: str = "actionable", figma_link: str = None) -> Dict[str, Any]:
         """Generate enhanced GroomRoom response with both Markdown and structured JSON data"""
         try:
             # Handle input - either Jira issue dict or content string
             if isinstance(jira_issue_or_content, str):
-                if re.match(r'^[A-Z]+-\d+$', jira_issue_or_content.strip()):
+                if _TICKET_KEY_RE.match(jira_issue_or_content.strip()):
                     # It's a ticket number, fetch from Jira
                     if not self.jira_integration:
                         return {"error": "Jira integration not available"}
@@ -3564,23 +4204,7 @@ Please try again or contact support if the issue persists."""
                         return {"error": f"Could not fetch ticket {jira_issue_or_content}"}
                 else:
                     # It's content, create minimal issue data
-                    jira_issue = {
-                        'key': 'PASTED-CONTENT',
-                        'fields': {
-                            'summary': 'Pasted Content Analysis',
-                            'description': jira_issue_or_content,
-                            'issuetype': {'name': 'Unknown'},
-                            'status': {'name': 'Unknown'},
-                            'priority': {'name': 'None'},
-                            'assignee': None,
-                            'reporter': None,
-                            'created': '',
-                            'updated': '',
-                            'project': {'name': 'Unknown'},
-                            'labels': [],
-                            'components': []
-                        }
-                    }
+                    jira_issue = _pasted_content_issue(jira_issue_or_content)
             else:
                 jira_issue = jira_issue_or_content
             
@@ -3640,15 +4264,12 @@ Please try again or contact support if the issue persists."""
             description = issue_data.get('description', '')
             if 'As a' in description and 'I want' in description:
                 # Extract persona and goal
-                lines = description.split('\n')
-                for line in lines:
-                    if 'As a' in line and 'I want' in line:
-                        parts = line.split('I want')
-                        if len(parts) >= 2:
-                            persona = parts[0].replace('As a', '').strip()
-                            goal = parts[1].split('so that')[0].strip()
-                            title = f"{goal} for {persona}"
-                            break
+                story_line = _STORY_LINE_RE.search(description)
+                if story_line:
+                    parts = story_line.group().split('I want')
+                    persona = parts[0].replace('As a', '').strip()
+                    goal = parts[1].split('so that')[0].strip()
+                    title = f"{goal} for {persona}"
             if not title:
                 title = f"Capability for User"
         
@@ -3690,7 +4311,7 @@ Please try again or contact support if the issue persists."""
         return {
             "TicketKey": ticket_key,
             "Title": title,
-            "Mode": mode.title(),
+            "Mode": _MODE_LABELS.get(mode) or mode.title(),
             "Readiness": {
                 "Score": readiness_score,
                 "Status": status,
@@ -3721,18 +4342,19 @@ Please try again or contact support if the issue persists."""
         recommendations = data["Recommendations"]
         
         # Determine emoji and mode-specific adjustments
-        if mode.lower() == "insight":
+        mode_lower = mode.lower()
+        if mode_lower == "insight":
             header_emoji = "🔍"
             mode_name = "Insight"
-        elif mode.lower() == "summary":
+        elif mode_lower == "summary":
             header_emoji = "📋"
             mode_name = "Summary"
         else:
             header_emoji = "⚡"
             mode_name = "Actionable"
         
-        # Build markdown report
-        markdown = f"""# {header_emoji} {mode_name} Groom Report — {ticket_key} | {title}
+        # Build markdown report; sections are collected and joined once
+        md_parts = [f"""# {header_emoji} {mode_name} Groom Report — {ticket_key} | {title}
 **Sprint Readiness:** {readiness['Score']}% → {readiness['Status']}
 
 ## 📋 Definition of Ready
@@ -3750,26 +4372,26 @@ Persona {'✅' if story_review['Persona'] else '❌'} | Goal {'✅' if story_rev
 
 ## ✅ Acceptance Criteria (testable; non-Gherkin allowed)
 Detected {ac_audit['Detected']} | Weak {ac_audit['Weak']}  
-"""
+"""]
         
         # Add acceptance criteria
         for i, rewrite in enumerate(ac_audit['SuggestedRewrites'], 1):
-            markdown += f"{i}) {rewrite}\n"
+            md_parts.append(f"{i}) {rewrite}\n")
         
-        markdown += "\n## 🧪 Test Scenarios (P/N/E)\n"
+        md_parts.append("\n## 🧪 Test Scenarios (P/N/E)\n")
         
         # Add test scenarios
         if test_scenarios['Positive']:
-            markdown += f"- **Positive:** {', '.join(test_scenarios['Positive'])}\n"
+            md_parts.append(f"- **Positive:** {', '.join(test_scenarios['Positive'])}\n")
         if test_scenarios['Negative']:
-            markdown += f"- **Negative:** {', '.join(test_scenarios['Negative'])}\n"
+            md_parts.append(f"- **Negative:** {', '.join(test_scenarios['Negative'])}\n")
         if test_scenarios['Error']:
-            markdown += f"- **Error/Resilience:** {', '.join(test_scenarios['Error'])}\n"
+            md_parts.append(f"- **Error/Resilience:** {', '.join(test_scenarios['Error'])}\n")
         
-        markdown += "\n## 🧱 Technical / ADA / Architecture\n"
-        markdown += f"- Implementation details: {technical_ada['ImplementationDetails']}\n"
-        markdown += f"- Architectural solution: {technical_ada['ArchitecturalSolution']}\n"
-        markdown += f"- ADA: {technical_ada['ADA']['Status']} — {', '.join(technical_ada['ADA']['Notes']) if technical_ada['ADA']['Notes'] else 'No issues'}\n"
+        md_parts.append("\n## 🧱 Technical / ADA / Architecture\n")
+        md_parts.append(f"- Implementation details: {technical_ada['ImplementationDetails']}\n")
+        md_parts.append(f"- Architectural solution: {technical_ada['ArchitecturalSolution']}\n")
+        md_parts.append(f"- ADA: {technical_ada['ADA']['Status']} — {', '.join(technical_ada['ADA']['Notes']) if technical_ada['ADA']['Notes'] else 'No issues'}\n")
         
         # Add NFRs
         nfr_parts = []
@@ -3781,27 +4403,27 @@ Detected {ac_audit['Detected']} | Weak {ac_audit['Weak']}
             nfr_parts.append(f"DevOps: {technical_ada['NFR']['DevOps']}")
         
         if nfr_parts:
-            markdown += f"- NFRs: {'; '.join(nfr_parts)}\n"
+            md_parts.append(f"- NFRs: {'; '.join(nfr_parts)}\n")
         
         # Add DesignSync if available
         if design_sync and design_sync.get('Enabled'):
-            markdown += f"\n## 🎨 DesignSync (if Figma linked)\n"
-            markdown += f"Score {design_sync['Score']}.\n"
+            md_parts.append(f"\n## 🎨 DesignSync (if Figma linked)\n")
+            md_parts.append(f"Score {design_sync['Score']}.\n")
             if design_sync.get('Mismatches'):
-                markdown += f"Mismatches: {' • '.join([f'• {m}' for m in design_sync['Mismatches']])}\n"
+                md_parts.append(f"Mismatches: {' • '.join([f'• {m}' for m in design_sync['Mismatches']])}\n")
             if design_sync.get('Changes'):
-                markdown += f"Changes: {' • '.join([f'• {c}' for c in design_sync['Changes']])}\n"
+                md_parts.append(f"Changes: {' • '.join([f'• {c}' for c in design_sync['Changes']])}\n")
         
         # Add recommendations
-        markdown += "\n## 💡 Recommendations\n"
+        md_parts.append("\n## 💡 Recommendations\n")
         if recommendations['PO']:
-            markdown += f"- **PO:** {', '.join(recommendations['PO'])}\n"
+            md_parts.append(f"- **PO:** {', '.join(recommendations['PO'])}\n")
         if recommendations['QA']:
-            markdown += f"- **QA:** {', '.join(recommendations['QA'])}\n"
+            md_parts.append(f"- **QA:** {', '.join(recommendations['QA'])}\n")
         if recommendations['Dev']:
-            markdown += f"- **Dev/Tech Lead:** {', '.join(recommendations['Dev'])}\n"
+            md_parts.append(f"- **Dev/Tech Lead:** {', '.join(recommendations['Dev'])}\n")
         
-        return markdown
+        return "".join(md_parts)
 
     def _calculate_dor_coverage(self, issue_data: Dict) -> float:
         """Calculate Definition of Ready coverage percentage"""
@@ -3853,13 +4475,10 @@ Detected {ac_audit['Detected']} | Weak {ac_audit['Weak']}
     def _calculate_technical_score(self, issue_data: Dict) -> float:
         """Calculate technical/ADA score"""
         score = 0
-        description = issue_data.get('description', '').lower()
+        description = _lower(issue_data.get('description', ''))
         
-        # Check for technical keywords
-        tech_keywords = ['api', 'database', 'security', 'performance', 'integration', 'architecture']
-        for keyword in tech_keywords:
-            if keyword in description:
-                score += 10
+        # Check for technical keywords; map() keeps each substring test in C
+        score += 10 * sum(map(description.__contains__, _TECH_SCORE_KEYWORDS))
         
         return min(100, score)
 
@@ -3875,11 +4494,9 @@ Detected {ac_audit['Detected']} | Weak {ac_audit['Weak']}
         suggested_rewrite = description
         if has_persona and has_goal and has_benefit:
             # Extract and improve the story
-            lines = description.split('\n')
-            for line in lines:
-                if 'As a' in line and 'I want' in line:
-                    suggested_rewrite = line.strip()
-                    break
+            story_line = _STORY_LINE_RE.search(description)
+            if story_line:
+                suggested_rewrite = story_line.group().strip()
         
         return {
             "Persona": has_persona,
@@ -3916,7 +4533,7 @@ Detected {ac_audit['Detected']} | Weak {ac_audit['Weak']}
 
     def _generate_test_scenarios(self, issue_data: Dict) -> Dict[str, List[str]]:
         """Generate P/N/E test scenarios"""
-        description = issue_data.get('description', '').lower()
+        description = _lower(issue_data.get('description', ''))
         
         positive = [
             "Valid input produces expected output",
@@ -3952,29 +4569,31 @@ Detected {ac_audit['Detected']} | Weak {ac_audit['Weak']}
 
     def _analyze_technical_ada(self, issue_data: Dict) -> Dict[str, Any]:
         """Analyze technical implementation and ADA requirements"""
-        description = issue_data.get('description', '').lower()
+        description = _lower(issue_data.get('description', ''))
+        # Every category below reads from a single scan of the description
+        hits = _scan_groups(_TECHNICAL_ADA_AUTOMATON, _TECHNICAL_ADA_GROUPS, description)
         
         # Determine implementation details status
-        if any(keyword in description for keyword in ['api', 'database', 'service']):
+        if 'impl_ok' in hits:
             impl_status = "OK"
-        elif any(keyword in description for keyword in ['system', 'application']):
+        elif 'impl_partial' in hits:
             impl_status = "Partial"
         else:
             impl_status = "Missing"
         
         # Determine architectural solution status
-        if any(keyword in description for keyword in ['architecture', 'design', 'pattern']):
+        if 'arch_ok' in hits:
             arch_status = "OK"
-        elif any(keyword in description for keyword in ['integration', 'component']):
+        elif 'arch_partial' in hits:
             arch_status = "Partial"
         else:
             arch_status = "Missing"
         
         # ADA analysis
         ada_notes = []
-        if 'accessibility' in description or 'ada' in description:
+        if 'ada_ok' in hits:
             ada_status = "OK"
-        elif 'ui' in description or 'interface' in description:
+        elif 'ada_partial' in hits:
             ada_status = "Partial"
             ada_notes.append("Consider keyboard navigation")
             ada_notes.append("Ensure screen reader compatibility")
@@ -3984,11 +4603,11 @@ Detected {ac_audit['Detected']} | Weak {ac_audit['Weak']}
         
         # NFR analysis
         nfr = {}
-        if 'performance' in description:
+        if 'performance' in hits:
             nfr['Performance'] = "Response time requirements specified"
-        if 'security' in description:
+        if 'security' in hits:
             nfr['Security'] = "Security considerations mentioned"
-        if 'deployment' in description or 'devops' in description:
+        if 'devops' in hits:
             nfr['DevOps'] = "Deployment considerations noted"
         
         return {
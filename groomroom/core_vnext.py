@@ -15,7 +15,7 @@ import openai
 # Load environment variables
 load_dotenv()
 
-@dataclass
+@dataclass(slots=True)
 class DesignLink:
     """Figma design link with metadata"""
     url: str
@@ -23,7 +23,7 @@ class DesignLink:
     node_ids: List[str] = None
     title: str = None
 
-@dataclass
+@dataclass(slots=True)
 class GroomroomResponse:
     """Structured response from GroomRoom analysis"""
     markdown: str